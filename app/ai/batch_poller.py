@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import httpx
+
+from app.core.logging import get_logger
+from app.models import ReportBatchJob, ReportResult
+
+if TYPE_CHECKING:  # pragma: no cover
+    from app.ai.report_generator import ReportGenerator
+
+logger = get_logger(__name__)
+
+
+class ReportBatchPoller:
+    """Track submitted report batches and render them once Azure OpenAI finishes.
+
+    Jobs and finished reports live in process memory; a restart drops batches still pending.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[str, ReportBatchJob] = {}
+        self._completed: dict[str, list[ReportResult]] = {}
+
+    def track(self, job: ReportBatchJob) -> None:
+        self._pending[job.batch_id] = job
+
+    def is_pending(self, batch_id: str) -> bool:
+        return batch_id in self._pending
+
+    def results(self, batch_id: str) -> list[ReportResult] | None:
+        return self._completed.get(batch_id)
+
+    async def poll_once(self, generator: ReportGenerator) -> None:
+        """Collect every pending batch that Azure reports as finished."""
+
+        for batch_id, job in list(self._pending.items()):
+            try:
+                results = await generator.complete_batched(job)
+            except httpx.HTTPError as exc:
+                # Transient: keep the job and try again on the next tick.
+                logger.warning("Polling report batch %s failed: %s", batch_id, exc)
+                continue
+            except RuntimeError:
+                logger.exception("Report batch %s failed; dropping it", batch_id)
+                del self._pending[batch_id]
+                continue
+            if results is None:
+                continue
+            del self._pending[batch_id]
+            self._completed[batch_id] = results
+            logger.info("Report batch %s rendered %d reports", batch_id, len(results))
+
+    async def run(
+        self,
+        generator_factory: Callable[[], ReportGenerator],
+        *,
+        interval_seconds: float = 60.0,
+    ) -> None:
+        """Poll pending batches until cancelled; the generator is only built once a job exists."""
+
+        while True:
+            await asyncio.sleep(interval_seconds)
+            if self._pending:
+                await self.poll_once(generator_factory())
@@ -1,14 +1,30 @@
 from __future__ import annotations
 
-from typing import Any, Iterable
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
 
 import httpx
+import orjson
 
 from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+THROTTLED_STATUS_CODES = frozenset({429})
+RETRYABLE_STATUS_CODES = THROTTLED_STATUS_CODES | {500, 502, 503, 504}
+BATCH_FAILED_STATUSES = frozenset({"failed", "expired", "cancelled", "cancelling"})
 
 
 class AzureOpenAIClient:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 1.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         settings = get_settings()
         if not settings.azure_gpt5_endpoint or not settings.azure_gpt5_api_key:
             raise RuntimeError("Azure GPT endpoint or API key not configured")
@@ -19,6 +35,30 @@ class AzureOpenAIClient:
         self._deployment = settings.azure_model_name_deployment
         self._api_version = settings.azure_openai_api_version
         self._api_key = settings.azure_gpt5_api_key
+        self._max_retries = max_retries
+        self._retry_backoff_seconds = retry_backoff_seconds
+        # Long-lived client so TLS sessions and keep-alive connections are reused across requests;
+        # HTTP/2 multiplexes concurrent completions over a single connection.
+        self._client = httpx.AsyncClient(
+            base_url=self._endpoint,
+            http2=True,
+            headers={"api-key": self._api_key},
+            params={"api-version": self._api_version},
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            transport=transport,
+        )
+
+    async def warmup(self) -> None:
+        """Open a connection to the endpoint so the first completion skips the TLS handshake.
+
+        Any HTTP status is fine here (the root path usually answers 404); failures are only logged.
+        """
+
+        try:
+            await self._client.get("/")
+        except httpx.HTTPError as exc:
+            logger.warning("Azure OpenAI warmup failed: %s", exc)
 
     async def chat_completion(
         self,
@@ -27,26 +67,174 @@ class AzureOpenAIClient:
         temperature: float = 0.1,
         max_tokens: int | None = None,
     ) -> str:
-        url = (
-            f"{self._endpoint}/openai/deployments/{self._deployment}/chat/completions"
+        url = f"/openai/deployments/{self._deployment}/chat/completions"
+        payload = self._completion_body(messages, temperature=temperature, max_tokens=max_tokens)
+        response = await self._post_with_retries(url, payload)
+        return self._extract_content(orjson.loads(response.content))
+
+    async def chat_completion_stream(
+        self,
+        messages: Iterable[dict[str, Any]],
+        *,
+        temperature: float = 0.1,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield content deltas as Azure OpenAI streams them back as server-sent events.
+
+        Throttling and transient 5xx responses are retried like :meth:`chat_completion`;
+        they are always answered before any event is sent.
+        """
+
+        url = f"/openai/deployments/{self._deployment}/chat/completions"
+        payload = self._completion_body(messages, temperature=temperature, max_tokens=max_tokens)
+        payload["stream"] = True
+
+        attempt = 0
+        while True:
+            async with self._client.stream("POST", url, json=payload) as response:
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= self._max_retries:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            return
+                        choices = orjson.loads(data).get("choices")
+                        # Azure sends content-filter events with no choices ahead of the deltas.
+                        if choices:
+                            content = (choices[0].get("delta") or {}).get("content")
+                            if content:
+                                yield content
+                    return
+                delay = self._retry_delay(response, attempt)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def submit_batch(
+        self,
+        requests: Iterable[tuple[str, Iterable[dict[str, Any]]]],
+        *,
+        temperature: float = 0.1,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Submit ``(custom_id, messages)`` pairs as an Azure OpenAI batch job and return its id.
+
+        Batch jobs complete within 24h at a lower cost than interactive completions; use
+        :meth:`poll_batch` to collect the results.
+        """
+
+        lines = []
+        for custom_id, messages in requests:
+            body = self._completion_body(messages, temperature=temperature, max_tokens=max_tokens)
+            body["model"] = self._deployment
+            lines.append(
+                orjson.dumps({"custom_id": custom_id, "method": "POST", "url": "/chat/completions", "body": body})
+            )
+        if not lines:
+            raise ValueError("batch requires at least one request")
+
+        upload = await self._client.post(
+            "/openai/files",
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", b"\n".join(lines), "application/jsonl")},
         )
-        headers = {
-            "Content-Type": "application/json",
-            "api-key": self._api_key,
-        }
-        params = {"api-version": self._api_version}
+        upload.raise_for_status()
+        file_id = orjson.loads(upload.content)["id"]
+
+        # Creating a job is not idempotent: a 5xx may arrive after the job exists, so only
+        # throttled requests (never accepted) are retried to avoid billing a duplicate batch.
+        response = await self._post_with_retries(
+            "/openai/batches",
+            {"input_file_id": file_id, "endpoint": "/chat/completions", "completion_window": "24h"},
+            retry_status_codes=THROTTLED_STATUS_CODES,
+        )
+        return orjson.loads(response.content)["id"]
+
+    async def poll_batch(self, batch_id: str) -> dict[str, str] | None:
+        """Return completion content keyed by ``custom_id``, or ``None`` while the batch is running.
+
+        Entries that failed inside an otherwise completed batch are omitted from the result; a
+        completed batch without an output file (every entry failed) yields an empty mapping.
+        """
+
+        response = await self._client.get(f"/openai/batches/{batch_id}")
+        response.raise_for_status()
+        batch = orjson.loads(response.content)
+        status = batch.get("status")
+        if status in BATCH_FAILED_STATUSES:
+            raise RuntimeError(f"Azure OpenAI batch {batch_id} ended with status {status}")
+        if status != "completed":
+            return None
+
+        output_file_id = batch.get("output_file_id")
+        if not output_file_id:
+            logger.warning(
+                "Azure OpenAI batch %s completed without output (error file: %s)",
+                batch_id,
+                batch.get("error_file_id"),
+            )
+            return {}
+
+        output = await self._client.get(f"/openai/files/{output_file_id}/content")
+        output.raise_for_status()
+        results: dict[str, str] = {}
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            item = orjson.loads(line)
+            response_item = item.get("response") or {}
+            if response_item.get("status_code") != 200:
+                # Failed entries are left out so callers can retry them interactively.
+                continue
+            results[item["custom_id"]] = self._extract_content(response_item["body"])
+        return results
+
+    @staticmethod
+    def _completion_body(
+        messages: Iterable[dict[str, Any]], *, temperature: float, max_tokens: int | None
+    ) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "messages": list(messages),
             "temperature": temperature,
         }
         if max_tokens is not None:
             payload["max_tokens"] = max_tokens
+        return payload
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, headers=headers, params=params, json=payload)
-            response.raise_for_status()
-            data = response.json()
+    @staticmethod
+    def _extract_content(data: dict[str, Any]) -> str:
         try:
             return data["choices"][0]["message"]["content"]
         except (KeyError, IndexError) as exc:
             raise RuntimeError("Unexpected response from Azure OpenAI") from exc
+
+    async def _post_with_retries(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        *,
+        retry_status_codes: frozenset[int] = RETRYABLE_STATUS_CODES,
+    ) -> httpx.Response:
+        """POST with exponential backoff on throttling (429) and, by default, transient 5xx responses."""
+
+        attempt = 0
+        while True:
+            response = await self._client.post(url, json=payload)
+            if response.status_code not in retry_status_codes or attempt >= self._max_retries:
+                response.raise_for_status()
+                return response
+            await asyncio.sleep(self._retry_delay(response, attempt))
+            attempt += 1
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        retry_after = response.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        return self._retry_backoff_seconds * (2**attempt)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import io
+import re
+import threading
+from collections.abc import Sequence
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import orjson
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from markupsafe import Markup, escape
 
 from app.ai.openai_client import AzureOpenAIClient
 from app.models import (
     CustomerProfile,
+    ReportBatchJob,
     ReportResult,
     ScenarioResult,
     ScenarioSummary,
@@ -19,35 +28,268 @@ from app.models import (
 from app.services.report_storage import AzureBlobReportStorage
 from app.services.scenario_builder import ScenarioBuilder
 
+if TYPE_CHECKING:  # pragma: no cover
+    from weasyprint import HTML
+    from weasyprint.text.fonts import FontConfiguration
+
+TEMPLATES_PATH = Path(__file__).resolve().parent.parent / "templates"
+
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "Eres un analista financiero senior. Analiza el JSON y devuelve un informe breve en español"
+        " usando solo texto plano (sin Markdown, tablas ni símbolos especiales). Sigue exactamente esta"
+        " estructura y no añadas encabezados adicionales:\n"
+        "Resumen ejecutivo:\n- frase1 (máx 20 palabras)\n- frase2 (máx 20 palabras)\n"
+        "Puntos clave por escenario:\n- Escenario 1 ...\n- Escenario 2 ...\n- Escenario 3 (<ID oferta si aplica>) ...\n"
+        "Recomendaciones y riesgos:\n- recomendación 1\n- recomendación 2\n"
+        "Usa frases diferentes a las del detalle numérico y evita repetir datos textuales que ya aparecerán"
+        " en la sección de escenarios. Mantén todo en español neutro y evita palabras en inglés."
+    ),
+}
+
+
+@lru_cache
+def _get_template() -> Template:
+    # Compiled once per process; templates ship with the image so reload checks are unnecessary.
+    environment = Environment(
+        loader=FileSystemLoader(TEMPLATES_PATH),
+        autoescape=select_autoescape(["html"]),
+        auto_reload=False,
+        cache_size=400,
+    )
+    return environment.get_template("report.html")
+
+
+_SANITIZE_TABLE = str.maketrans(
+    {
+        "\u2013": "-",  # en dash
+        "\u2014": "-",  # em dash
+        "\u2011": "-",  # non-breaking hyphen
+        "\u201c": '"',
+        "\u201d": '"',
+        "\u2018": "'",
+        "\u2019": "'",
+        "\u2022": "\u00b7",  # bullet -> middle dot
+        "\u202f": " ",  # narrow no-break space
+        "\u00a0": " ",  # no-break space
+    }
+)
+_SECTION_HEADER_RE = re.compile(r"(resumen ejecutivo|puntos clave|recomendaciones|riesgos)", re.IGNORECASE)
+_SECTION_BY_HEADER = {
+    "resumen ejecutivo": "summary",
+    "puntos clave": "scenarios",
+    "recomendaciones": "risks",
+    "riesgos": "risks",
+}
+
+
+@lru_cache(maxsize=256)
+def _format_currency_cached(value: Decimal) -> Markup:
+    # A report repeats a handful of amounts (balance, payments, totals) across its scenarios.
+    # Digits and separators never need escaping, so the template can skip autoescape on them.
+    return Markup(f"S/. {value:,.2f}")
+
+
+@lru_cache(maxsize=256)
+def _escape_note(note: str) -> Markup:
+    # Scenario notes come from a small set of builder templates, so sanitize and escape each once.
+    # Model-written narrative lines are untrusted and stay on the template's autoescape path.
+    return escape(note.translate(_SANITIZE_TABLE))
+
+
+def _new_run_id() -> str:
+    return f"rpt_{uuid4().hex[:8]}"
+
+
+_NATIVE_LIBS_MESSAGE = (
+    "WeasyPrint requiere librerías nativas (cairo, pango, gdk-pixbuf). En macOS instala con 'brew install cairo pango gdk-pixbuf libffi'."  # noqa: EM101
+)
+
+
+@lru_cache
+def _get_pdf_backend() -> type[HTML]:
+    # WeasyPrint pulls in cairo/pango bindings; import it on the first render only.
+    try:
+        from weasyprint import HTML
+    except ImportError as exc:  # pragma: no cover - runtime guard
+        raise RuntimeError(
+            "WeasyPrint no está instalado. Ejecuta 'uv add weasyprint' o 'pip install weasyprint' para habilitar la generación de PDF."  # noqa: EM101
+        ) from exc
+    except OSError as exc:  # pragma: no cover - depends on system libs
+        raise RuntimeError(_NATIVE_LIBS_MESSAGE) from exc
+    return HTML
+
+
+_pdf_state = threading.local()
+
+
+def _get_font_config() -> FontConfiguration:
+    # Reuse fontconfig state between renders instead of rebuilding it per PDF; one per thread
+    # because FontConfiguration is not safe to share across concurrent renders.
+    font_config = getattr(_pdf_state, "font_config", None)
+    if font_config is None:
+        from weasyprint.text.fonts import FontConfiguration
+
+        font_config = _pdf_state.font_config = FontConfiguration()
+    return font_config
+
+
+class _NarrativeParser:
+    """Split the model narrative into template sections as text arrives in arbitrary chunks."""
+
+    def __init__(self) -> None:
+        self._summary: list[str] = []
+        self._scenarios: list[str] = []
+        self._risks: list[str] = []
+        self._sections = {"summary": self._summary, "scenarios": self._scenarios, "risks": self._risks}
+        self._current = self._summary
+        self._pending = ""
+
+    def feed(self, text: str) -> None:
+        # The table only maps single characters, so each chunk is sanitized in one pass as it
+        # arrives. Universal-newline mode folds \r\n and \r into \n as lines are read lazily.
+        buffer = io.StringIO(self._pending + text.translate(_SANITIZE_TABLE), newline=None)
+        self._pending = ""
+        for line in buffer:
+            if not line.endswith("\n"):
+                # The last line stays buffered until its line break arrives.
+                self._pending = line
+                break
+            self._feed_line(line)
+
+    def close(self) -> dict[str, list[str]]:
+        if self._pending:
+            self._feed_line(self._pending)
+            self._pending = ""
+
+        # Fallbacks to guarantee sections for template
+        if not self._summary:
+            self._summary.append("Se generó el reporte con los datos proporcionados.")
+        if not self._scenarios:
+            self._scenarios.append("Ver detalle numérico en la sección inferior.")
+        if not self._risks:
+            self._risks.append("Revise los supuestos de ingreso y variabilidad antes de avanzar.")
+
+        return {"summary": self._summary, "scenarios": self._scenarios, "risks": self._risks}
+
+    def _feed_line(self, raw_line: str) -> None:
+        line = raw_line.strip()
+        if not line:
+            return
+        header = _SECTION_HEADER_RE.match(line)
+        if header:
+            self._current = self._sections[_SECTION_BY_HEADER[header.group(1).lower()]]
+            return
+        if line.startswith("-"):
+            line = line.lstrip("- ")
+        self._current.append(line)
+
 
 class ReportGenerator:
-    def __init__(self, scenario_builder: ScenarioBuilder) -> None:
+    def __init__(
+        self, scenario_builder: ScenarioBuilder, openai_client: AzureOpenAIClient | None = None
+    ) -> None:
         self._scenario_builder = scenario_builder
-        self._openai_client = AzureOpenAIClient()
+        self._openai_client = openai_client or AzureOpenAIClient()
         self._storage = AzureBlobReportStorage()
-        templates_path = Path(__file__).resolve().parent.parent / "templates"
-        self._jinja = Environment(
-            loader=FileSystemLoader(templates_path),
-            autoescape=select_autoescape(["html"]),
-        )
-        self._template = self._jinja.get_template("report.html")
+        self._template = _get_template()
 
     async def generate(self, customer_id: str) -> ReportResult:
         profile, summary = self._scenario_builder.build_summary(customer_id)
-        narrative = await self._build_narrative(profile, summary)
-        parsed_narrative = self._parse_narrative(narrative)
-        run_id = f"rpt_{uuid4().hex[:8]}"
+        narrative, sections = await self._build_narrative(profile, summary)
+        return await self._render_and_store(
+            profile, summary, narrative, sections, run_id=_new_run_id()
+        )
+
+    async def generate_many(
+        self, customer_ids: Sequence[str], *, max_concurrency: int = 10
+    ) -> list[ReportResult]:
+        """Generate reports concurrently, keeping at most ``max_concurrency`` in flight.
+
+        Results are returned in the same order as ``customer_ids``. If any report fails, the
+        remaining generations are cancelled and the first error is raised.
+        """
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _generate_one(customer_id: str) -> ReportResult:
+            async with semaphore:
+                return await self.generate(customer_id)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(_generate_one(customer_id)) for customer_id in customer_ids]
+        except ExceptionGroup as errors:
+            # Surface the failure as a single generate() call would.
+            raise errors.exceptions[0] from None
+        return [task.result() for task in tasks]
+
+    async def submit_batched(self, customer_ids: Sequence[str]) -> ReportBatchJob:
+        """Queue the narratives of non-urgent reports through the Azure OpenAI Batch API.
+
+        Each customer gets its run id up front; it doubles as the batch ``custom_id``.
+        """
+
+        customer_ids_by_run: dict[str, str] = {}
+        requests: list[tuple[str, list[dict[str, str]]]] = []
+        for customer_id in customer_ids:
+            profile, summary = self._scenario_builder.build_summary(customer_id)
+            run_id = _new_run_id()
+            customer_ids_by_run[run_id] = customer_id
+            requests.append((run_id, self._build_messages(profile, summary)))
+        batch_id = await self._openai_client.submit_batch(requests, temperature=0.2)
+        return ReportBatchJob(batch_id=batch_id, customer_ids_by_run=customer_ids_by_run)
+
+    async def complete_batched(self, job: ReportBatchJob) -> list[ReportResult] | None:
+        """Render and store the reports of a finished batch, or return ``None`` while it runs.
+
+        Narratives missing from the batch output are requested interactively instead.
+        """
+
+        narratives = await self._openai_client.poll_batch(job.batch_id)
+        if narratives is None:
+            return None
+
+        results: list[ReportResult] = []
+        for run_id, customer_id in job.customer_ids_by_run.items():
+            # Scenario data is static, so rebuilding the summary matches what was submitted.
+            profile, summary = self._scenario_builder.build_summary(customer_id)
+            narrative = narratives.get(run_id)
+            if narrative is None:
+                narrative, sections = await self._build_narrative(profile, summary)
+            else:
+                sections = self._parse_narrative(narrative)
+            results.append(
+                await self._render_and_store(profile, summary, narrative, sections, run_id=run_id)
+            )
+        return results
+
+    async def _render_and_store(
+        self,
+        profile: CustomerProfile,
+        summary: ScenarioSummary,
+        narrative: str,
+        narrative_sections: dict[str, list[str]],
+        *,
+        run_id: str,
+    ) -> ReportResult:
         rendered_at = datetime.utcnow()
-        pdf_bytes = self._render_pdf(
+        # Rendering and uploading are blocking; run them off the event loop so other
+        # requests keep progressing while this PDF is produced.
+        pdf_bytes = await asyncio.to_thread(
+            self._render_pdf,
             profile,
             summary,
-            parsed_narrative,
+            narrative_sections,
             run_id=run_id,
             generated_at=rendered_at,
         )
-        upload = self._storage.upload(customer_id=customer_id, data=pdf_bytes, run_id=run_id)
+        upload = await asyncio.to_thread(
+            self._storage.upload, customer_id=profile.customer_id, data=pdf_bytes, run_id=run_id
+        )
         return ReportResult(
-            customer_id=customer_id,
+            customer_id=profile.customer_id,
             run_id=upload.run_id,
             blob_path=upload.blob_path,
             url=upload.url,
@@ -58,28 +300,29 @@ class ReportGenerator:
 
     async def _build_narrative(
         self, profile: CustomerProfile, summary: ScenarioSummary
-    ) -> str:
+    ) -> tuple[str, dict[str, list[str]]]:
+        """Stream the narrative, parsing each completed line while the model keeps generating."""
+
+        messages = self._build_messages(profile, summary)
+        parser = _NarrativeParser()
+        chunks: list[str] = []
+        async for delta in self._openai_client.chat_completion_stream(messages, temperature=0.2):
+            chunks.append(delta)
+            parser.feed(delta)
+        return "".join(chunks), parser.close()
+
+    def _build_messages(
+        self, profile: CustomerProfile, summary: ScenarioSummary
+    ) -> list[dict[str, str]]:
         payload = self._build_structured_payload(profile, summary)
-        messages = [
-            {
-                "role": "system",
-                "content": (
-                    "Eres un analista financiero senior. Analiza el JSON y devuelve un informe breve en español"
-                    " usando solo texto plano (sin Markdown, tablas ni símbolos especiales). Sigue exactamente esta"
-                    " estructura y no añadas encabezados adicionales:\n"
-                    "Resumen ejecutivo:\n- frase1 (máx 20 palabras)\n- frase2 (máx 20 palabras)\n"
-                    "Puntos clave por escenario:\n- Escenario 1 ...\n- Escenario 2 ...\n- Escenario 3 (<ID oferta si aplica>) ...\n"
-                    "Recomendaciones y riesgos:\n- recomendación 1\n- recomendación 2\n"
-                    "Usa frases diferentes a las del detalle numérico y evita repetir datos textuales que ya aparecerán"
-                    " en la sección de escenarios. Mantén todo en español neutro y evita palabras en inglés."
-                ),
-            },
+        payload_json = orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+        return [
+            _SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": f"Datos del cliente en JSON:\n```json\n{json.dumps(payload, ensure_ascii=False, indent=2)}\n```",
+                "content": f"Datos del cliente en JSON:\n```json\n{payload_json}\n```",
             },
         ]
-        return await self._openai_client.chat_completion(messages, temperature=0.2)
 
     def _build_structured_payload(
         self, profile: CustomerProfile, summary: ScenarioSummary
@@ -138,25 +381,17 @@ class ReportGenerator:
                     "savings_vs_minimum": self._format_currency(scenario.savings_vs_minimum)
                     if scenario.savings_vs_minimum is not None
                     else None,
-                    "notes": [self._sanitize(note) for note in scenario.notes],
+                    "notes": [_escape_note(note) for note in scenario.notes],
                 }
                 for scenario in summary.scenarios
             ],
         }
         html = self._template.render(**context)
+        html_document = _get_pdf_backend()
         try:
-            from weasyprint import HTML  # delayed import to keep optional dependency lazy
-        except ImportError as exc:  # pragma: no cover - runtime guard
-            raise RuntimeError(
-                "WeasyPrint no está instalado. Ejecuta 'uv add weasyprint' o 'pip install weasyprint' para habilitar la generación de PDF."  # noqa: EM101
-            ) from exc
-
-        try:
-            return HTML(string=html).write_pdf()
+            return html_document(string=html).write_pdf(font_config=_get_font_config())
         except OSError as exc:  # pragma: no cover - depends on system libs
-            raise RuntimeError(
-                "WeasyPrint requiere librerías nativas (cairo, pango, gdk-pixbuf). En macOS instala con 'brew install cairo pango gdk-pixbuf libffi'."  # noqa: EM101
-            ) from exc
+            raise RuntimeError(_NATIVE_LIBS_MESSAGE) from exc
 
     @staticmethod
     def _scenario_title(scenario: ScenarioResult) -> str:
@@ -174,61 +409,18 @@ class ReportGenerator:
 
     @staticmethod
     def _sanitize(text: str) -> str:
-        replacements = {
-            "–": "-",
-            "—": "-",
-            "‑": "-",  # non-breaking hyphen
-            "“": '"',
-            "”": '"',
-            "‘": "'",
-            "’": "'",
-            "•": "·",
-            "·": "·",
-            " ": " ",  # narrow no-break space
-            " ": " ",  # no-break space
-        }
-        for src, dst in replacements.items():
-            text = text.replace(src, dst)
-        return text
+        return text.translate(_SANITIZE_TABLE)
 
     @staticmethod
     def _format_currency(value: Decimal | str) -> str:
         if isinstance(value, str):
             value = Decimal(value)
-        return f"S/. {value:,.2f}"
+        if not value:
+            # -0.00 and 0.00 share a cache key, so drop the sign to keep the output order-independent.
+            value = value.copy_abs()
+        return _format_currency_cached(value)
 
     def _parse_narrative(self, narrative: str) -> dict[str, list[str]]:
-        summary: list[str] = []
-        scenarios: list[str] = []
-        risks: list[str] = []
-
-        current = None
-        for raw_line in narrative.splitlines():
-            line = raw_line.strip()
-            if not line:
-                continue
-            lower = line.lower()
-            if lower.startswith("resumen ejecutivo"):
-                current = summary
-                continue
-            if lower.startswith("puntos clave"):
-                current = scenarios
-                continue
-            if lower.startswith("recomendaciones") or lower.startswith("riesgos"):
-                current = risks
-                continue
-            if line.startswith("-"):
-                text = self._sanitize(line.lstrip("- "))
-                (current or summary).append(text)
-            else:
-                (current or summary).append(self._sanitize(line))
-
-        # Fallbacks to guarantee sections for template
-        if not summary:
-            summary.append("Se generó el reporte con los datos proporcionados.")
-        if not scenarios:
-            scenarios.append("Ver detalle numérico en la sección inferior.")
-        if not risks:
-            risks.append("Revise los supuestos de ingreso y variabilidad antes de avanzar.")
-
-        return {"summary": summary, "scenarios": scenarios, "risks": risks}
+        parser = _NarrativeParser()
+        parser.feed(narrative)
+        return parser.close()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from functools import lru_cache
+import hmac
+from functools import cache
 from typing import TYPE_CHECKING
 
 from fastapi import Header, HTTPException, status
@@ -9,32 +10,58 @@ from app.core.config import get_settings
 from app.services import DataRepository, DebtConsolidationAnalyzer, ScenarioBuilder
 
 if TYPE_CHECKING:  # pragma: no cover
+    from app.ai.batch_poller import ReportBatchPoller
+    from app.ai.openai_client import AzureOpenAIClient
     from app.ai.report_generator import ReportGenerator
 
 
-@lru_cache
+@cache
 def get_repository() -> DataRepository:
     return DataRepository()
 
 
-@lru_cache
+@cache
 def get_analyzer() -> DebtConsolidationAnalyzer:
     repository = get_repository()
     return DebtConsolidationAnalyzer(repository.offers)
 
 
-@lru_cache
+@cache
 def get_scenario_builder() -> ScenarioBuilder:
     repository = get_repository()
     analyzer = get_analyzer()
     return ScenarioBuilder(repository, analyzer)
 
 
-@lru_cache
-def get_report_generator() -> "ReportGenerator":
-    from app.ai.report_generator import ReportGenerator  # avoid importing heavy deps unless needed
+@cache
+def get_openai_client() -> AzureOpenAIClient:
+    from app.ai.openai_client import AzureOpenAIClient
 
-    return ReportGenerator(get_scenario_builder())
+    return AzureOpenAIClient()
+
+
+@cache
+def get_report_generator() -> ReportGenerator:
+    # Imported lazily to avoid loading Jinja and WeasyPrint unless reports are needed.
+    from app.ai.report_generator import ReportGenerator
+
+    return ReportGenerator(get_scenario_builder(), openai_client=get_openai_client())
+
+
+@cache
+def get_batch_poller() -> ReportBatchPoller:
+    from app.ai.batch_poller import ReportBatchPoller
+
+    return ReportBatchPoller()
+
+
+async def close_openai_client() -> None:
+    # Only close what was actually created; the client may never have been needed.
+    if get_openai_client.cache_info().currsize:
+        await get_openai_client().aclose()
+        # Drop the closed client (and the generator holding it) so a later lifespan builds fresh ones.
+        get_report_generator.cache_clear()
+        get_openai_client.cache_clear()
 
 
 def require_api_key(x_api_key: str | None = Header(default=None, alias="X-API-Key")) -> None:
@@ -45,7 +72,8 @@ def require_api_key(x_api_key: str | None = Header(default=None, alias="X-API-Ke
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="API key not configured",
         )
-    if x_api_key is None or x_api_key != expected:
+    # Constant-time comparison so response timing does not leak how much of the key matched.
+    if not x_api_key or not hmac.compare_digest(x_api_key.encode(), expected.encode()):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response serialized with orjson.
+
+    FastAPI's own ``ORJSONResponse`` is deprecated in recent releases; this keeps the same
+    output on every FastAPI version the project allows.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -5,6 +5,7 @@ from decimal import Decimal
 from fastapi import APIRouter, Depends
 
 from app.api.deps import get_scenario_builder, require_api_key
+from app.api.responses import OrjsonResponse
 from app.models import ScenarioSummary
 from app.schemas.request import EvaluationRequest
 from app.schemas.response import EvaluationResponse, OfferEvaluationSchema, RuleResultSchema, ScenarioSchema
@@ -13,7 +14,12 @@ from app.services.scenario_builder import ScenarioBuilder
 router = APIRouter(prefix="/v1", tags=["evaluation"], dependencies=[Depends(require_api_key)])
 
 
-@router.post("/evaluation", response_model=EvaluationResponse, summary="Evaluate consolidation eligibility and scenarios")
+@router.post(
+    "/evaluation",
+    response_model=EvaluationResponse,
+    response_class=OrjsonResponse,
+    summary="Evaluate consolidation eligibility and scenarios",
+)
 def evaluate_customer(
     payload: EvaluationRequest,
     scenario_builder: ScenarioBuilder = Depends(get_scenario_builder),
@@ -27,16 +33,18 @@ def _to_response(
     summary: ScenarioSummary,
     consolidated_balance: Decimal,
 ) -> EvaluationResponse:
+    # Everything below comes from our own domain objects and FastAPI validates the response
+    # against ``response_model`` anyway, so skip the per-field validation on construction.
     eligibility = summary.eligibility
     best_offer = eligibility.best_offer.offer.offer_id if eligibility.best_offer else None
 
     def map_offer(evaluation) -> OfferEvaluationSchema:
-        return OfferEvaluationSchema(
+        return OfferEvaluationSchema.model_construct(
             offer_id=evaluation.offer.offer_id,
             passed=evaluation.passed,
-            reasons=list(evaluation.reasons),
+            reasons=evaluation.reasons,
             rule_results=[
-                RuleResultSchema(rule=rule.rule, passed=rule.passed, detail=rule.detail)
+                RuleResultSchema.model_construct(rule=rule.rule, passed=rule.passed, detail=rule.detail)
                 for rule in evaluation.rule_results
             ],
             new_rate_pct=evaluation.offer.new_rate_pct,
@@ -44,20 +52,20 @@ def _to_response(
         )
 
     scenarios = [
-        ScenarioSchema(
+        ScenarioSchema.model_construct(
             scenario_type=scenario.scenario_type,
             monthly_payment=scenario.monthly_payment,
             payoff_months=scenario.payoff_months,
             total_paid=scenario.total_paid,
             interest_cost=scenario.interest_cost,
             savings_vs_minimum=scenario.savings_vs_minimum,
-            notes=list(scenario.notes),
+            notes=scenario.notes,
             consolidation_offer_id=scenario.consolidation_offer_id,
         )
         for scenario in summary.scenarios
     ]
 
-    return EvaluationResponse(
+    return EvaluationResponse.model_construct(
         customer_id=customer_id,
         consolidated_balance=consolidated_balance,
         is_eligible=eligibility.is_eligible,
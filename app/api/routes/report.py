@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from typing import Annotated, Literal
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+
+from app.ai.batch_poller import ReportBatchPoller
 from app.ai.report_generator import ReportGenerator
-from app.api.deps import get_report_generator, require_api_key
-from app.schemas.report_request import ReportRequest
-from app.schemas.report_response import ReportResponse
+from app.api.deps import get_batch_poller, get_report_generator, require_api_key
+from app.models import ReportResult
+from app.schemas.report_request import ReportBatchRequest, ReportRequest
+from app.schemas.report_response import (
+    ReportBatchJobResponse,
+    ReportBatchResponse,
+    ReportResponse,
+)
 
 router = APIRouter(prefix="/v1", tags=["report"], dependencies=[Depends(require_api_key)])
 
@@ -13,9 +21,58 @@ router = APIRouter(prefix="/v1", tags=["report"], dependencies=[Depends(require_
 @router.post("/report", response_model=ReportResponse, summary="Generar informe en PDF con IA")
 async def create_report(
     payload: ReportRequest,
-    generator: ReportGenerator = Depends(get_report_generator),
+    generator: Annotated[ReportGenerator, Depends(get_report_generator)],
 ) -> ReportResponse:
     result = await generator.generate(payload.customer_id)
+    return _to_response(result)
+
+
+@router.post(
+    "/report/batch",
+    response_model=ReportBatchResponse | ReportBatchJobResponse,
+    summary="Generar informes en PDF con IA para varios clientes",
+)
+async def create_report_batch(
+    payload: ReportBatchRequest,
+    response: Response,
+    generator: Annotated[ReportGenerator, Depends(get_report_generator)],
+    poller: Annotated[ReportBatchPoller, Depends(get_batch_poller)],
+    mode: Annotated[
+        Literal["interactive", "deferred"],
+        Query(description="'deferred' encola las narrativas en Azure OpenAI Batch (hasta 24 h, menor costo)"),
+    ] = "interactive",
+) -> ReportBatchResponse | ReportBatchJobResponse:
+    if mode == "deferred":
+        job = await generator.submit_batched(payload.customer_ids)
+        poller.track(job)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return ReportBatchJobResponse(batch_id=job.batch_id, status="pending")
+    results = await generator.generate_many(payload.customer_ids)
+    return ReportBatchResponse(reports=[_to_response(result) for result in results])
+
+
+@router.get(
+    "/report/batch/{batch_id}",
+    response_model=ReportBatchJobResponse,
+    summary="Consultar un lote diferido de informes",
+)
+async def get_report_batch(
+    batch_id: str,
+    poller: Annotated[ReportBatchPoller, Depends(get_batch_poller)],
+) -> ReportBatchJobResponse:
+    results = poller.results(batch_id)
+    if results is not None:
+        return ReportBatchJobResponse(
+            batch_id=batch_id,
+            status="completed",
+            reports=[_to_response(result) for result in results],
+        )
+    if poller.is_pending(batch_id):
+        return ReportBatchJobResponse(batch_id=batch_id, status="pending")
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Lote no encontrado")
+
+
+def _to_response(result: ReportResult) -> ReportResponse:
     return ReportResponse(
         customer_id=result.customer_id,
         report_url=result.url,
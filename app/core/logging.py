@@ -3,10 +3,19 @@ from __future__ import annotations
 import logging
 from logging.config import dictConfig
 
+_CONFIGURED = False
+
 
 def configure_logging(level: str = "INFO") -> None:
-    """Apply a consistent logging configuration for the service."""
+    """Apply a consistent logging configuration for the service.
+
+    Only the first call takes effect: ``dictConfig`` resets every registered logger's cache,
+    so repeated calls are skipped.
+    """
 
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
     dictConfig(
         {
             "version": 1,
@@ -29,6 +38,7 @@ def configure_logging(level: str = "INFO") -> None:
             },
         }
     )
+    _CONFIGURED = True
 
 
 def get_logger(name: str) -> logging.Logger:
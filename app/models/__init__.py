@@ -9,7 +9,7 @@ from .decision import (
     ScenarioSummary,
     ScenarioType,
 )
-from .report import ReportResult
+from .report import ReportBatchJob, ReportResult
 from .offer import Offer, OfferRuleConfig
 
 __all__ = [
@@ -28,5 +28,6 @@ __all__ = [
     "ScenarioResult",
     "ScenarioSummary",
     "ScenarioType",
+    "ReportBatchJob",
     "ReportResult",
 ]
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Self
 
-from .common import ProductType
+from .common import ProductType, monthly_rate_from_annual_pct
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Account:
     account_id: str
     customer_id: str
@@ -23,16 +24,20 @@ class Account:
             raise ValueError(f"invalid decimal for {field}: {value}") from exc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CardAccount(Account):
     annual_rate_pct: Decimal
     min_payment_pct: Decimal
     payment_due_day: int
+    monthly_rate: Decimal = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "monthly_rate", monthly_rate_from_annual_pct(self.annual_rate_pct))
 
     @classmethod
     def from_csv_row(cls, row: dict[str, str]) -> Self:
         account_id = row["card_id"].strip()
-        customer_id = row["customer_id"].strip()
+        customer_id = sys.intern(row["customer_id"].strip())
         balance = cls._parse_decimal(row["balance"], "balance")
         annual_rate_pct = cls._parse_decimal(row["annual_rate_pct"], "annual_rate_pct")
         min_payment_pct = cls._parse_decimal(row["min_payment_pct"], "min_payment_pct")
@@ -50,16 +55,20 @@ class CardAccount(Account):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoanAccount(Account):
     annual_rate_pct: Decimal
     remaining_term_months: int
     collateral: bool
+    monthly_rate: Decimal = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "monthly_rate", monthly_rate_from_annual_pct(self.annual_rate_pct))
 
     @classmethod
     def from_csv_row(cls, row: dict[str, str]) -> Self:
         account_id = row["loan_id"].strip()
-        customer_id = row["customer_id"].strip()
+        customer_id = sys.intern(row["customer_id"].strip())
         principal = cls._parse_decimal(row["principal"], "principal")
         annual_rate_pct = cls._parse_decimal(row["annual_rate_pct"], "annual_rate_pct")
         remaining_term = int(row["remaining_term_months"])
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from decimal import Decimal
 from enum import StrEnum
 
 
@@ -14,18 +16,40 @@ class ProductType(StrEnum):
 
     @classmethod
     def from_raw(cls, raw: str) -> "ProductType":
-        value = raw.strip().lower()
-        for member in cls:
-            if value == member.value:
-                return member
-        aliases = {
-            "personal_loan": cls.PERSONAL,
-            "personal-loan": cls.PERSONAL,
-            "micro_loan": cls.MICRO,
-            "micro-loan": cls.MICRO,
-            "credit_card": cls.CARD,
-            "credit-card": cls.CARD,
-        }
-        if value in aliases:
-            return aliases[value]
-        return cls.OTHER
+        return _LOOKUP.get(raw.strip().lower(), cls.OTHER)
+
+    @property
+    def bit(self) -> int:
+        return _BITS[self]
+
+
+# Built once at import; enum members and aliases never change at runtime.
+_LOOKUP: dict[str, ProductType] = {member.value: member for member in ProductType} | {
+    "personal_loan": ProductType.PERSONAL,
+    "personal-loan": ProductType.PERSONAL,
+    "micro_loan": ProductType.MICRO,
+    "micro-loan": ProductType.MICRO,
+    "credit_card": ProductType.CARD,
+    "credit-card": ProductType.CARD,
+}
+_BITS: dict[ProductType, int] = {
+    member: 1 << index for index, member in enumerate(ProductType)
+}
+
+
+def product_type_mask(types: Iterable[ProductType]) -> int:
+    """Fold product types into a bitmask so eligibility checks are a single integer AND."""
+
+    mask = 0
+    for product_type in types:
+        mask |= _BITS[product_type]
+    return mask
+
+
+# Annual percentage to monthly fraction in one correctly rounded division; ``pct / 100`` is exact,
+# so this equals ``(pct / 100) / 12``.
+_ANNUAL_PCT_PER_MONTHLY_RATE = Decimal(1200)
+
+
+def monthly_rate_from_annual_pct(annual_rate_pct: Decimal) -> Decimal:
+    return annual_rate_pct / _ANNUAL_PCT_PER_MONTHLY_RATE
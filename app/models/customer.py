@@ -1,28 +1,33 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
-from typing import Iterable, Sequence
+from functools import cached_property
+from itertools import chain
+from typing import Any
 
 from .account import CardAccount, LoanAccount
-from .common import ProductType
+from .common import ProductType, product_type_mask
 
+_ZERO = Decimal(0)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CashflowSummary:
     monthly_income_avg: Decimal
     income_variability_pct: Decimal
     essential_expenses_avg: Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreditScoreRecord:
     score: int
     recorded_on: date
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RiskIndicators:
     latest_credit_score: int | None
     credit_score_date: date | None
@@ -30,6 +35,7 @@ class RiskIndicators:
     has_active_delinquency: bool
 
 
+# Not slotted: the cached_property views below need an instance __dict__.
 @dataclass(frozen=True)
 class CustomerProfile:
     customer_id: str
@@ -38,12 +44,30 @@ class CustomerProfile:
     loans: Sequence[LoanAccount] = field(default_factory=tuple)
     cashflow: CashflowSummary | None = None
     credit_history: Sequence[CreditScoreRecord] = field(default_factory=tuple)
+    # Cache behind risk_indicators. Not an init argument, so dataclasses.replace never carries
+    # indicators over to a profile with different accounts; kept out of eq/repr.
+    _risk_indicators: RiskIndicators | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if self.requested_term_months is not None and self.requested_term_months <= 0:
             raise ValueError("requested_term_months must be positive when provided")
 
-    @property
+    @classmethod
+    def with_risk_indicators(
+        cls, risk_indicators: RiskIndicators, /, **fields: Any
+    ) -> CustomerProfile:
+        """Build a profile whose risk indicators were already derived from the same accounts."""
+
+        profile = cls(**fields)
+        object.__setattr__(profile, "_risk_indicators", risk_indicators)
+        return profile
+
+    # Derived views are cached per instance; cached_property writes to __dict__ directly, so it
+    # works on the frozen dataclass and never affects eq/hash.
+
+    @cached_property
     def product_types_owned(self) -> frozenset[ProductType]:
         types: set[ProductType] = set()
         if self.cards:
@@ -51,26 +75,43 @@ class CustomerProfile:
         types.update(loan.product_type for loan in self.loans)
         return frozenset(types)
 
-    @property
+    @cached_property
+    def product_type_mask(self) -> int:
+        return product_type_mask(self.product_types_owned)
+
+    @cached_property
     def consolidated_balance(self) -> Decimal:
-        card_balance = sum((card.balance for card in self.cards), Decimal("0"))
-        loan_balance = sum((loan.balance for loan in self.loans), Decimal("0"))
-        return card_balance + loan_balance
+        # Single pass over both account kinds; sums stay exact Decimal cents.
+        return sum((account.balance for account in chain(self.cards, self.loans)), _ZERO)
 
     @property
     def risk_indicators(self) -> RiskIndicators:
-        scores = sorted(self.credit_history, key=lambda record: record.recorded_on, reverse=True)
-        latest = scores[0] if scores else None
-        max_dpd = _max_days_past_due(self.cards, self.loans)
-        return RiskIndicators(
-            latest_credit_score=latest.score if latest else None,
-            credit_score_date=latest.recorded_on if latest else None,
-            max_days_past_due=max_dpd,
-            has_active_delinquency=max_dpd > 0,
-        )
+        # The repository seeds this at load time; profiles built elsewhere derive it on first use.
+        risk = self._risk_indicators
+        if risk is None:
+            risk = build_risk_indicators(self.cards, self.loans, latest_record(self.credit_history))
+            object.__setattr__(self, "_risk_indicators", risk)
+        return risk
+
+
+def build_risk_indicators(
+    cards: Iterable[CardAccount],
+    loans: Iterable[LoanAccount],
+    latest: CreditScoreRecord | None,
+) -> RiskIndicators:
+    max_dpd = _max_days_past_due(cards, loans)
+    return RiskIndicators(
+        latest_credit_score=latest.score if latest else None,
+        credit_score_date=latest.recorded_on if latest else None,
+        max_days_past_due=max_dpd,
+        has_active_delinquency=max_dpd > 0,
+    )
+
+
+def latest_record(history: Iterable[CreditScoreRecord]) -> CreditScoreRecord | None:
+    # max() keeps the first of equal dates, the same record a stable reverse sort puts first.
+    return max(history, key=lambda record: record.recorded_on, default=None)
 
 
 def _max_days_past_due(cards: Iterable[CardAccount], loans: Iterable[LoanAccount]) -> int:
-    dpd_values = [card.days_past_due for card in cards]
-    dpd_values.extend(loan.days_past_due for loan in loans)
-    return max(dpd_values) if dpd_values else 0
+    return max((account.days_past_due for account in chain(cards, loans)), default=0)
@@ -15,14 +15,14 @@ class ScenarioType(StrEnum):
     CONSOLIDATION_SURPLUS = "consolidation_surplus"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuleEvaluation:
     rule: str
     passed: bool
     detail: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OfferEvaluation:
     offer: Offer
     passed: bool
@@ -35,7 +35,7 @@ class OfferEvaluation:
         return tuple(positives + negatives)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EligibilityResult:
     customer_id: str
     requested_term_months: int | None
@@ -51,7 +51,7 @@ class EligibilityResult:
         return bool(self.eligible_offers)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScenarioResult:
     scenario_type: ScenarioType
     monthly_payment: Decimal
@@ -63,7 +63,7 @@ class ScenarioResult:
     consolidation_offer_id: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScenarioSummary:
     eligibility: EligibilityResult
     scenarios: tuple[ScenarioResult, ...]
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import FrozenSet
 
-from .common import ProductType
+from .common import ProductType, monthly_rate_from_annual_pct, product_type_mask
 
+_MIN_SCORE_RE = re.compile(r"score\s*[>=]+\s*(\d+)")
+_DPD_RE = re.compile(r"(\d+)\s*d[ií]as")
+_DPD_GT_RE = re.compile(r">\s*(\d+)\s*d[ií]as")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class OfferRuleConfig:
     min_credit_score: int | None = None
     max_days_past_due: int | None = None
@@ -31,7 +36,7 @@ class OfferRuleConfig:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Offer:
     offer_id: str
     product_types_eligible: FrozenSet[ProductType]
@@ -40,12 +45,27 @@ class Offer:
     max_term_months: int
     conditions: str
     rule_config: OfferRuleConfig
+    eligible_type_mask: int = field(init=False, repr=False, compare=False)
+    max_balance_text: str = field(init=False, repr=False, compare=False)
+    eligible_types_text: str = field(init=False, repr=False, compare=False)
+    monthly_rate: Decimal = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "eligible_type_mask", product_type_mask(self.product_types_eligible))
+        object.__setattr__(self, "monthly_rate", monthly_rate_from_annual_pct(self.new_rate_pct))
+        # Rule details quote the limit for every evaluated customer; format the Decimal once.
+        object.__setattr__(self, "max_balance_text", f"{self.max_consolidated_balance:.2f}")
+        object.__setattr__(
+            self, "eligible_types_text", str(sorted(t.value for t in self.product_types_eligible))
+        )
 
     @classmethod
     def from_dict(cls, data: dict) -> "Offer":
         offer_id = data.get("offer_id")
         if not offer_id:
             raise ValueError("offer_id is required")
+        if isinstance(offer_id, str):
+            offer_id = sys.intern(offer_id)
 
         raw_types = data.get("product_types_eligible") or []
         if not raw_types:
@@ -91,7 +111,7 @@ def _to_decimal(value: object, *, field: str) -> Decimal:
 
 
 def _extract_min_score(text: str) -> int | None:
-    match = re.search(r"score\s*[>=]+\s*(\d+)", text)
+    match = _MIN_SCORE_RE.search(text)
     if match:
         return int(match.group(1))
     return None
@@ -100,10 +120,10 @@ def _extract_min_score(text: str) -> int | None:
 def _extract_max_dpd(text: str) -> int | None:
     if "sin mora" in text and "activa" in text:
         return 0
-    match = re.search(r"(\d+)\s*d[ií]as", text)
+    match = _DPD_RE.search(text)
     if match:
         return int(match.group(1))
-    range_match = re.search(r">\s*(\d+)\s*d[ií]as", text)
+    range_match = _DPD_GT_RE.search(text)
     if range_match:
         return int(range_match.group(1))
     return None
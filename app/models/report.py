@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
 
 from .decision import ScenarioSummary
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReportResult:
     customer_id: str
     run_id: str
@@ -15,3 +16,9 @@ class ReportResult:
     generated_at: datetime
     narrative: str
     summary: ScenarioSummary
+
+
+@dataclass(frozen=True, slots=True)
+class ReportBatchJob:
+    batch_id: str
+    customer_ids_by_run: Mapping[str, str]
@@ -5,3 +5,12 @@ from pydantic import BaseModel, Field
 
 class ReportRequest(BaseModel):
     customer_id: str = Field(..., description="Identificador del cliente a evaluar")
+
+
+class ReportBatchRequest(BaseModel):
+    customer_ids: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="Identificadores de los clientes para los que se generará un informe",
+    )
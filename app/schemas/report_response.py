@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel
 
@@ -11,3 +12,13 @@ class ReportResponse(BaseModel):
     blob_path: str
     run_id: str
     generated_at: datetime
+
+
+class ReportBatchResponse(BaseModel):
+    reports: list[ReportResponse]
+
+
+class ReportBatchJobResponse(BaseModel):
+    batch_id: str
+    status: Literal["pending", "completed"]
+    reports: list[ReportResponse] = []
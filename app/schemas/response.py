@@ -17,7 +17,7 @@ class RuleResultSchema(BaseModel):
 class OfferEvaluationSchema(BaseModel):
     offer_id: str
     passed: bool
-    reasons: list[str]
+    reasons: tuple[str, ...]
     rule_results: list[RuleResultSchema]
     new_rate_pct: Decimal
     max_term_months: int
@@ -30,7 +30,7 @@ class ScenarioSchema(BaseModel):
     total_paid: Decimal
     interest_cost: Decimal
     savings_vs_minimum: Optional[Decimal]
-    notes: list[str]
+    notes: tuple[str, ...]
     consolidation_offer_id: Optional[str] = None
 
 
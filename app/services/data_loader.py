@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import csv
 import json
+import sys
+from collections.abc import Iterable
+from dataclasses import replace
 from datetime import date
 from decimal import Decimal
 from functools import cached_property
+from itertools import chain
 from pathlib import Path
-from typing import Iterable
 
 from app.models import (
     CardAccount,
@@ -16,6 +19,9 @@ from app.models import (
     LoanAccount,
     Offer,
 )
+from app.models.customer import build_risk_indicators, latest_record
+
+_READ_BUFFER_SIZE = 1 << 20
 
 
 class DataRepository:
@@ -29,17 +35,25 @@ class DataRepository:
         path = self.data_dir / "bank_offers.json"
         with path.open("r", encoding="utf-8") as handle:
             raw_offers = json.load(handle)
-        return tuple(Offer.from_dict(item) for item in raw_offers)
+        return tuple([Offer.from_dict(item) for item in raw_offers])
 
     @cached_property
     def cards(self) -> tuple[CardAccount, ...]:
         path = self.data_dir / "cards.csv"
-        return tuple(CardAccount.from_csv_row(row) for row in _read_csv(path))
+        return tuple([CardAccount.from_csv_row(row) for row in _read_csv(path)])
 
     @cached_property
     def loans(self) -> tuple[LoanAccount, ...]:
         path = self.data_dir / "loans.csv"
-        return tuple(LoanAccount.from_csv_row(row) for row in _read_csv(path))
+        return tuple([LoanAccount.from_csv_row(row) for row in _read_csv(path)])
+
+    @cached_property
+    def _cards_by_customer(self) -> dict[str, tuple[CardAccount, ...]]:
+        return _group_by_customer(self.cards)
+
+    @cached_property
+    def _loans_by_customer(self) -> dict[str, tuple[LoanAccount, ...]]:
+        return _group_by_customer(self.loans)
 
     @cached_property
     def credit_scores(self) -> dict[str, tuple[CreditScoreRecord, ...]]:
@@ -48,17 +62,26 @@ class DataRepository:
         for row in _read_csv(path):
             record = CreditScoreRecord(
                 score=int(row["credit_score"]),
-                recorded_on=date.fromisoformat(row["date"]),
+                recorded_on=date.fromisoformat(row["date"].strip()),
             )
-            history.setdefault(row["customer_id"], []).append(record)
+            history.setdefault(sys.intern(row["customer_id"].strip()), []).append(record)
         return {customer: tuple(sorted(records, key=lambda r: r.recorded_on)) for customer, records in history.items()}
 
+    @cached_property
+    def latest_credit_scores(self) -> dict[str, CreditScoreRecord]:
+        # Resolved once at load so profiles do not rescan their history on every evaluation.
+        return {
+            customer: record
+            for customer, records in self.credit_scores.items()
+            if (record := latest_record(records)) is not None
+        }
+
     @cached_property
     def cashflows(self) -> dict[str, CashflowSummary]:
         path = self.data_dir / "customer_cashflow.csv"
         summaries: dict[str, CashflowSummary] = {}
         for row in _read_csv(path):
-            summaries[row["customer_id"]] = CashflowSummary(
+            summaries[sys.intern(row["customer_id"].strip())] = CashflowSummary(
                 monthly_income_avg=_to_decimal(row["monthly_income_avg"]),
                 income_variability_pct=_to_decimal(row["income_variability_pct"]),
                 essential_expenses_avg=_to_decimal(row["essential_expenses_avg"]),
@@ -66,10 +89,10 @@ class DataRepository:
         return summaries
 
     def get_cards(self, customer_id: str) -> tuple[CardAccount, ...]:
-        return tuple(card for card in self.cards if card.customer_id == customer_id)
+        return self._cards_by_customer.get(customer_id, ())
 
     def get_loans(self, customer_id: str) -> tuple[LoanAccount, ...]:
-        return tuple(loan for loan in self.loans if loan.customer_id == customer_id)
+        return self._loans_by_customer.get(customer_id, ())
 
     def get_credit_history(self, customer_id: str) -> tuple[CreditScoreRecord, ...]:
         return self.credit_scores.get(customer_id, ())
@@ -77,28 +100,71 @@ class DataRepository:
     def get_cashflow(self, customer_id: str) -> CashflowSummary | None:
         return self.cashflows.get(customer_id)
 
+    @cached_property
+    def profiles(self) -> dict[str, CustomerProfile]:
+        # Built once for every customer present in any dataset; profiles are immutable, so their
+        # cached derived views (balance, risk, product types) are shared across requests.
+        customer_ids = dict.fromkeys(
+            chain(self._cards_by_customer, self._loans_by_customer, self.credit_scores, self.cashflows)
+        )
+        return {customer_id: self._new_profile(customer_id) for customer_id in customer_ids}
+
+    def preload(self) -> int:
+        """Load the account datasets and build every profile now; returns the number of customers."""
+
+        return len(self.profiles)
+
     def build_customer_profile(
         self, customer_id: str, requested_term_months: int | None = None
     ) -> CustomerProfile:
-        return CustomerProfile(
+        profile = self.profiles.get(customer_id)
+        if profile is None:
+            # Unknown ids still get an empty profile, but are not cached.
+            profile = self._new_profile(customer_id)
+        if requested_term_months is None:
+            return profile
+        return replace(profile, requested_term_months=requested_term_months)
+
+    def _new_profile(self, customer_id: str) -> CustomerProfile:
+        cards = self.get_cards(customer_id)
+        loans = self.get_loans(customer_id)
+        return CustomerProfile.with_risk_indicators(
+            build_risk_indicators(cards, loans, self.latest_credit_scores.get(customer_id)),
             customer_id=customer_id,
-            requested_term_months=requested_term_months,
-            cards=self.get_cards(customer_id),
-            loans=self.get_loans(customer_id),
+            cards=cards,
+            loans=loans,
             cashflow=self.get_cashflow(customer_id),
             credit_history=self.get_credit_history(customer_id),
         )
 
 
+def _group_by_customer[AccountT: (CardAccount, LoanAccount)](
+    accounts: Iterable[AccountT],
+) -> dict[str, tuple[AccountT, ...]]:
+    # File order is preserved within each customer, matching the previous linear scans.
+    grouped: dict[str, list[AccountT]] = {}
+    for account in accounts:
+        grouped.setdefault(account.customer_id, []).append(account)
+    return {customer: tuple(items) for customer, items in grouped.items()}
+
+
 def _read_csv(path: Path) -> Iterable[dict[str, str]]:
     if not path.exists():
         raise FileNotFoundError(path)
-    with path.open("r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            if not any(row.values()):
+    with path.open("r", encoding="utf-8", newline="", buffering=_READ_BUFFER_SIZE) as handle:
+        # csv.reader plus a header read once avoids DictReader's per-row Python bookkeeping.
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return
+        width = len(header)
+        for values in reader:
+            if not any(values):
                 continue
-            yield {key: (value or "").strip() for key, value in row.items()}
+            if len(values) < width:
+                values.extend([""] * (width - len(values)))
+            # Fields are stripped by the parsers that need it; Decimal() and int() accept padding.
+            yield dict(zip(header, values))
 
 
 def _to_decimal(value: str) -> Decimal:
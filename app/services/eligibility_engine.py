@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from decimal import Decimal
-from typing import Iterable, Sequence
 
 from app.models import (
     CustomerProfile,
@@ -21,17 +21,21 @@ class DebtConsolidationAnalyzer:
         eligible: list[OfferEvaluation] = []
         rejected: list[OfferEvaluation] = []
         balance = customer.consolidated_balance
+        balance_text = f"{balance:.2f}"
         risk = customer.risk_indicators
+        owned_text = str(sorted(t.value for t in customer.product_types_owned))
+        owned_mask = customer.product_type_mask
+        # self.offers is sorted by sort_key once in __init__, so both lists come out in that order.
         for offer in self.offers:
-            rule_results = tuple(self._evaluate_offer(offer, customer, balance, risk))
+            rule_results = self._evaluate_offer(
+                offer, customer, balance, balance_text, risk, owned_text, owned_mask
+            )
             passed = all(rule.passed for rule in rule_results)
             evaluation = OfferEvaluation(offer=offer, passed=passed, rule_results=rule_results)
             if passed:
                 eligible.append(evaluation)
             else:
                 rejected.append(evaluation)
-        eligible.sort(key=lambda evaluation: evaluation.offer.sort_key)
-        rejected.sort(key=lambda evaluation: evaluation.offer.sort_key)
         return EligibilityResult(
             customer_id=customer.customer_id,
             requested_term_months=customer.requested_term_months,
@@ -44,81 +48,101 @@ class DebtConsolidationAnalyzer:
         offer: Offer,
         customer: CustomerProfile,
         balance: Decimal,
+        balance_text: str,
         risk: RiskIndicators,
-    ) -> Iterable[RuleEvaluation]:
-        owned_types = customer.product_types_owned
-        type_match = bool(owned_types & offer.product_types_eligible)
-        yield RuleEvaluation(
-            rule="product_type_match",
-            passed=type_match,
-            detail=(
-                f"products owned {sorted(t.value for t in owned_types)} match eligible {sorted(t.value for t in offer.product_types_eligible)}"
-                if type_match
-                else f"missing eligible product types {sorted(t.value for t in offer.product_types_eligible)}"
-            ),
-        )
+        owned_text: str,
+        owned_mask: int,
+    ) -> tuple[RuleEvaluation, ...]:
+        # Built as a flat list rather than a generator: every rule is always materialized, so the
+        # generator protocol only added per-rule resume overhead.
+        rules = offer.rule_config
+        type_match = (owned_mask & offer.eligible_type_mask) != 0
+        results = [
+            RuleEvaluation(
+                rule="product_type_match",
+                passed=type_match,
+                detail=(
+                    f"products owned {owned_text} match eligible {offer.eligible_types_text}"
+                    if type_match
+                    else f"missing eligible product types {offer.eligible_types_text}"
+                ),
+            )
+        ]
 
         balance_pass = balance <= offer.max_consolidated_balance
-        yield RuleEvaluation(
-            rule="max_consolidated_balance",
-            passed=balance_pass,
-            detail=(
-                f"balance {balance:.2f} <= {offer.max_consolidated_balance:.2f}"
-                if balance_pass
-                else f"balance {balance:.2f} exceeds {offer.max_consolidated_balance:.2f}"
-            ),
+        results.append(
+            RuleEvaluation(
+                rule="max_consolidated_balance",
+                passed=balance_pass,
+                detail=(
+                    f"balance {balance_text} <= {offer.max_balance_text}"
+                    if balance_pass
+                    else f"balance {balance_text} exceeds {offer.max_balance_text}"
+                ),
+            )
         )
 
         if customer.requested_term_months is not None:
             term_pass = customer.requested_term_months <= offer.max_term_months
-            yield RuleEvaluation(
-                rule="max_term_months",
-                passed=term_pass,
-                detail=(
-                    f"term {customer.requested_term_months} <= {offer.max_term_months}"
-                    if term_pass
-                    else f"term {customer.requested_term_months} exceeds {offer.max_term_months}"
-                ),
+            results.append(
+                RuleEvaluation(
+                    rule="max_term_months",
+                    passed=term_pass,
+                    detail=(
+                        f"term {customer.requested_term_months} <= {offer.max_term_months}"
+                        if term_pass
+                        else f"term {customer.requested_term_months} exceeds {offer.max_term_months}"
+                    ),
+                )
             )
 
-        min_score = offer.rule_config.min_credit_score
+        min_score = rules.min_credit_score
         latest_score = risk.latest_credit_score
         if min_score is not None:
             if latest_score is None:
-                yield RuleEvaluation(
-                    rule="min_credit_score",
-                    passed=False,
-                    detail="missing credit score data",
+                results.append(
+                    RuleEvaluation(
+                        rule="min_credit_score",
+                        passed=False,
+                        detail="missing credit score data",
+                    )
                 )
             else:
                 score_pass = latest_score >= min_score
-                yield RuleEvaluation(
-                    rule="min_credit_score",
-                    passed=score_pass,
-                    detail=(
-                        f"score {latest_score} >= {min_score}"
-                        if score_pass
-                        else f"score {latest_score} < {min_score}"
-                    ),
+                results.append(
+                    RuleEvaluation(
+                        rule="min_credit_score",
+                        passed=score_pass,
+                        detail=(
+                            f"score {latest_score} >= {min_score}"
+                            if score_pass
+                            else f"score {latest_score} < {min_score}"
+                        ),
+                    )
                 )
 
-        max_dpd = offer.rule_config.max_days_past_due
+        max_dpd = rules.max_days_past_due
         if max_dpd is not None:
             dpd_pass = risk.max_days_past_due <= max_dpd
-            yield RuleEvaluation(
-                rule="max_days_past_due",
-                passed=dpd_pass,
-                detail=(
-                    f"max DPD {risk.max_days_past_due} <= {max_dpd}"
-                    if dpd_pass
-                    else f"max DPD {risk.max_days_past_due} > {max_dpd}"
-                ),
+            results.append(
+                RuleEvaluation(
+                    rule="max_days_past_due",
+                    passed=dpd_pass,
+                    detail=(
+                        f"max DPD {risk.max_days_past_due} <= {max_dpd}"
+                        if dpd_pass
+                        else f"max DPD {risk.max_days_past_due} > {max_dpd}"
+                    ),
+                )
             )
 
-        if offer.rule_config.disallow_active_delinquencies:
+        if rules.disallow_active_delinquencies:
             delinquency_pass = not risk.has_active_delinquency
-            yield RuleEvaluation(
-                rule="no_active_delinquencies",
-                passed=delinquency_pass,
-                detail="no active delinquencies" if delinquency_pass else "active delinquency present",
+            results.append(
+                RuleEvaluation(
+                    rule="no_active_delinquencies",
+                    passed=delinquency_pass,
+                    detail="no active delinquencies" if delinquency_pass else "active delinquency present",
+                )
             )
+        return tuple(results)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Protocol
 from uuid import uuid4
@@ -13,6 +14,11 @@ from app.core.config import get_settings
 if TYPE_CHECKING:  # pragma: no cover
     from azure.storage.blob import BlobSasPermissions, BlobServiceClient
 
+# PDFs up to 16 MiB go up in a single PUT; larger ones are split into 8 MiB blocks uploaded in parallel.
+_MAX_SINGLE_PUT_SIZE = 16 * 1024 * 1024
+_MAX_BLOCK_SIZE = 8 * 1024 * 1024
+_UPLOAD_CONCURRENCY = 4
+
 
 class StorageUploader(Protocol):
     def upload(self, *, customer_id: str, data: bytes) -> "UploadResult":
@@ -29,7 +35,7 @@ class UploadResult:
 
 class AzureBlobReportStorage(StorageUploader):
     def __init__(self) -> None:
-        from azure.storage.blob import BlobSasPermissions, BlobServiceClient, generate_blob_sas  # type: ignore
+        from azure.storage.blob import BlobSasPermissions, generate_blob_sas  # type: ignore
 
         settings = get_settings()
         if not settings.azure_storage_account_url or not settings.azure_storage_account_key:
@@ -42,10 +48,7 @@ class AzureBlobReportStorage(StorageUploader):
         self._container = settings.azure_storage_container
         self._BlobSasPermissions: type[BlobSasPermissions] = BlobSasPermissions  # type: ignore[name-defined]
         self._generate_blob_sas = generate_blob_sas
-        self._service_client: BlobServiceClient = BlobServiceClient(  # type: ignore[name-defined]
-            account_url=self._account_url,
-            credential=self._account_key,
-        )
+        self._service_client = _get_service_client(self._account_url, self._account_key)
         self._account_name = self._service_client.account_name
 
     def upload(self, *, customer_id: str, data: bytes, run_id: str | None = None) -> UploadResult:
@@ -58,7 +61,12 @@ class AzureBlobReportStorage(StorageUploader):
             container=self._container,
             blob=blob_path,
         )
-        blob_client.upload_blob(data, overwrite=True, content_type="application/pdf")
+        blob_client.upload_blob(
+            data,
+            overwrite=True,
+            content_type="application/pdf",
+            max_concurrency=_UPLOAD_CONCURRENCY,
+        )
 
         sas_token = self._generate_blob_sas(
             account_name=self._account_name,
@@ -83,3 +91,16 @@ class AzureBlobReportStorage(StorageUploader):
             f"run={run_id}",
         ) / "report.pdf"
         return str(path).replace("\\", "/")
+
+
+@lru_cache
+def _get_service_client(account_url: str, account_key: str) -> BlobServiceClient:
+    # One client (and connection pool) per account, shared by every storage instance.
+    from azure.storage.blob import BlobServiceClient  # type: ignore
+
+    return BlobServiceClient(
+        account_url=account_url,
+        credential=account_key,
+        max_single_put_size=_MAX_SINGLE_PUT_SIZE,
+        max_block_size=_MAX_BLOCK_SIZE,
+    )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal, getcontext
+from functools import lru_cache
 from typing import Sequence
 
 from app.models import (
@@ -19,8 +20,16 @@ from .eligibility_engine import DebtConsolidationAnalyzer
 
 getcontext().prec = 28
 
-ZERO = Decimal("0")
+ZERO = Decimal(0)
+ONE = Decimal(1)
+HALF = Decimal("0.5")
+HUNDRED = Decimal(100)
 TWOPLACES = Decimal("0.01")
+ZERO_CENTS = Decimal("0.00")
+
+# Products with more significant digits than this are rounded by the Decimal context before quantizing.
+_PRECISION = getcontext().prec
+_PRECISION_LIMIT = 10**_PRECISION
 
 
 @dataclass
@@ -29,18 +38,31 @@ class _Debt:
     balance: Decimal
     monthly_rate: Decimal
     min_payment: Decimal
+    # Exact integer forms for the cents engine; None when a value has no exact cents form.
+    balance_cents: int | None = field(init=False, repr=False)
+    min_payment_cents: int | None = field(init=False, repr=False)
+    rate_ratio: tuple[int, int] | None = field(init=False, repr=False)
 
-    def copy(self) -> "_Debt":
-        return _Debt(self.name, self.balance, self.monthly_rate, self.min_payment)
+    def __post_init__(self) -> None:
+        self.balance_cents = _whole_cents(self.balance)
+        self.min_payment_cents = _whole_cents(self.min_payment)
+        self.rate_ratio = _exact_rate(self.monthly_rate)
 
 
 class ScenarioBuilder:
     def __init__(self, repository: DataRepository, analyzer: DebtConsolidationAnalyzer) -> None:
         self._repository = repository
         self._analyzer = analyzer
+        # Repository data is loaded once per process, so a summary is fixed for each key.
+        self._summaries = lru_cache(maxsize=1024)(self._build_summary)
 
     def build_summary(
         self, customer_id: str, requested_term_months: int | None = None
+    ) -> tuple[CustomerProfile, ScenarioSummary]:
+        return self._summaries(customer_id, requested_term_months)
+
+    def _build_summary(
+        self, customer_id: str, requested_term_months: int | None
     ) -> tuple[CustomerProfile, ScenarioSummary]:
         profile = self._repository.build_customer_profile(customer_id, requested_term_months)
         eligibility = self._analyzer.evaluate(profile)
@@ -50,7 +72,7 @@ class ScenarioBuilder:
     def _build_scenarios(
         self, profile: CustomerProfile, eligibility: EligibilityResult
     ) -> tuple[ScenarioResult, ...]:
-        debts = self._build_debts(profile.cards, profile.loans)
+        debts, minimum_budget = self._build_debts(profile.cards, profile.loans)
         if not debts:
             notes = ("No se detectaron deudas activas para analizar",)
             empty = ScenarioResult(
@@ -64,12 +86,14 @@ class ScenarioBuilder:
             )
             return (empty,)
 
-        minimum_budget = sum(debt.min_payment for debt in debts)
+        # Without cashflow headroom the optimized budget equals the minimum one; share that payoff.
+        payoffs: dict[Decimal, tuple[int | None, Decimal, Decimal]] = {}
         min_result = self._simulate_scenario(
             debts,
             monthly_budget=minimum_budget,
             scenario_type=ScenarioType.MINIMUM_PAYMENT,
             base_notes=("Solo se pagan los mínimos contractuales en todas las cuentas",),
+            payoffs=payoffs,
         )
 
         optimized_budget = self._optimized_budget(profile, minimum_budget)
@@ -79,6 +103,7 @@ class ScenarioBuilder:
             scenario_type=ScenarioType.OPTIMIZED_PLAN,
             base_notes=("El excedente de caja prioriza saldos con mayor tasa primero",),
             baseline_interest=min_result.interest_cost,
+            payoffs=payoffs,
         )
 
         consolidation_results = self._build_consolidation_scenarios(
@@ -90,13 +115,18 @@ class ScenarioBuilder:
 
         return (min_result, optimized_result, *consolidation_results)
 
-    def _build_debts(self, cards: Sequence[CardAccount], loans: Sequence[LoanAccount]) -> list[_Debt]:
+    def _build_debts(
+        self, cards: Sequence[CardAccount], loans: Sequence[LoanAccount]
+    ) -> tuple[list[_Debt], Decimal]:
         debts: list[_Debt] = []
+        minimum_budget = ZERO
         for card in cards:
-            monthly_rate = (card.annual_rate_pct / Decimal("100")) / Decimal("12")
-            min_payment = (card.balance * (card.min_payment_pct / Decimal("100"))).quantize(TWOPLACES)
-            interest_only = (card.balance * monthly_rate).quantize(TWOPLACES)
-            min_payment = max(min_payment, interest_only)
+            monthly_rate = card.monthly_rate
+            # Rounding to cents is monotonic, so quantizing the larger amount once is equivalent.
+            min_payment = card.balance * (card.min_payment_pct / HUNDRED)
+            interest_only = card.balance * monthly_rate
+            min_payment = max(min_payment, interest_only).quantize(TWOPLACES)
+            minimum_budget += min_payment
             debts.append(
                 _Debt(
                     name=f"card:{card.account_id}",
@@ -106,8 +136,9 @@ class ScenarioBuilder:
                 )
             )
         for loan in loans:
-            monthly_rate = (loan.annual_rate_pct / Decimal("100")) / Decimal("12")
+            monthly_rate = loan.monthly_rate
             min_payment = self._amortized_payment(loan.balance, monthly_rate, loan.remaining_term_months)
+            minimum_budget += min_payment
             debts.append(
                 _Debt(
                     name=f"loan:{loan.account_id}",
@@ -116,14 +147,14 @@ class ScenarioBuilder:
                     min_payment=min_payment,
                 )
             )
-        return debts
+        return debts, minimum_budget
 
     def _optimized_budget(self, profile: CustomerProfile, minimum_budget: Decimal) -> Decimal:
         cashflow = profile.cashflow
         if cashflow is None:
             return minimum_budget
         disposable_income = cashflow.monthly_income_avg - cashflow.essential_expenses_avg
-        buffer = cashflow.monthly_income_avg * (cashflow.income_variability_pct / Decimal("100")) * Decimal("0.5")
+        buffer = cashflow.monthly_income_avg * (cashflow.income_variability_pct / HUNDRED) * HALF
         budget = disposable_income - buffer
         if budget < minimum_budget:
             return minimum_budget
@@ -136,6 +167,7 @@ class ScenarioBuilder:
         scenario_type: ScenarioType,
         base_notes: tuple[str, ...],
         baseline_interest: Decimal | None = None,
+        payoffs: dict[Decimal, tuple[int | None, Decimal, Decimal]] | None = None,
     ) -> ScenarioResult:
         if monthly_budget <= ZERO:
             notes = base_notes + ("Insufficient budget to service debts",)
@@ -149,13 +181,17 @@ class ScenarioBuilder:
                 notes=notes,
             )
 
-        months, total_interest, total_paid = self._simulate_payoff(debts, monthly_budget)
+        if payoffs is None:
+            payoff = self._simulate_payoff(debts, monthly_budget)
+        elif (payoff := payoffs.get(monthly_budget)) is None:
+            payoff = payoffs[monthly_budget] = self._simulate_payoff(debts, monthly_budget)
+        months, total_interest, total_paid = payoff
         payoff_months = months if months is not None else None
         savings = None
         if baseline_interest is not None and total_interest is not None:
             savings = (baseline_interest - total_interest).quantize(TWOPLACES)
         elif baseline_interest is None:
-            savings = Decimal("0.00")
+            savings = ZERO_CENTS
 
         notes = base_notes
         if payoff_months is None:
@@ -174,8 +210,22 @@ class ScenarioBuilder:
     def _simulate_payoff(
         self, debts: Sequence[_Debt], monthly_budget: Decimal, max_months: int = 600
     ) -> tuple[int | None, Decimal, Decimal]:
-        working = [debt.copy() for debt in debts]
-        balances = [debt.balance for debt in working]
+        inputs = _payoff_inputs_in_cents(debts, monthly_budget)
+        if inputs is None:
+            return self._simulate_payoff_decimal(debts, monthly_budget, max_months)
+        months, total_interest, total_paid = _simulate_payoff_cents(*inputs, max_months=max_months)
+        return months, _from_cents(total_interest), _from_cents(total_paid)
+
+    def _simulate_payoff_decimal(
+        self, debts: Sequence[_Debt], monthly_budget: Decimal, max_months: int
+    ) -> tuple[int | None, Decimal, Decimal]:
+        # Reference engine for inputs the cents engine cannot represent exactly (sub-cent amounts).
+        # Parallel lists keep the month loop on list indexing instead of attribute lookups.
+        count = len(debts)
+        balances = [debt.balance for debt in debts]
+        rates = [debt.monthly_rate for debt in debts]
+        min_payments = [debt.min_payment for debt in debts]
+        order = _extra_payment_order(rates)
         total_interest = ZERO
         total_paid = ZERO
         months = 0
@@ -186,46 +236,41 @@ class ScenarioBuilder:
 
             months += 1
             month_interest = ZERO
-            for idx, debt in enumerate(working):
+            payments = [ZERO] * count
+            for idx in range(count):
                 balance = balances[idx]
                 if balance <= ZERO:
                     continue
-                interest = balance * debt.monthly_rate
-                interest = interest.quantize(TWOPLACES)
-                balances[idx] = balance + interest
+                interest = (balance * rates[idx]).quantize(TWOPLACES)
+                balance += interest
+                balances[idx] = balance
                 month_interest += interest
-
-            payments = [ZERO] * len(working)
-            active_indices = [idx for idx, balance in enumerate(balances) if balance > ZERO]
-            for idx in active_indices:
-                balance = balances[idx]
-                min_payment = working[idx].min_payment
-                payment = min(min_payment, balance)
-                payments[idx] = payment
+                if balance > ZERO:
+                    payments[idx] = min(min_payments[idx], balance)
 
             required_payment = sum(payments)
-            budget = monthly_budget
-            if required_payment > budget:
-                budget = required_payment
+            budget = max(monthly_budget, required_payment)
 
             extra = budget - required_payment
-            while extra > ZERO and active_indices:
-                idx = max(active_indices, key=lambda i: working[i].monthly_rate)
+            for idx in order:
+                if extra <= ZERO:
+                    break
                 balance = balances[idx]
+                if balance <= ZERO:
+                    continue
                 remaining = balance - payments[idx]
                 if remaining <= ZERO:
-                    active_indices.remove(idx)
                     continue
                 add_payment = min(extra, remaining)
                 payments[idx] += add_payment
                 extra -= add_payment
 
             month_paid = ZERO
-            for idx, payment in enumerate(payments):
+            for idx in range(count):
                 balance = balances[idx]
                 if balance <= ZERO:
                     continue
-                actual_payment = min(payment, balances[idx])
+                actual_payment = min(payments[idx], balance)
                 balances[idx] = balance - actual_payment
                 month_paid += actual_payment
 
@@ -260,23 +305,32 @@ class ScenarioBuilder:
             )
 
         results: list[ScenarioResult] = []
+        # Balance and surplus are fixed for the customer, so offers sharing a rate and maximum
+        # term accelerate identically.
+        accelerated: dict[tuple[Decimal, int], tuple[int | None, Decimal, Decimal]] = {}
+        requested_term = profile.requested_term_months
+        account_count = len(profile.cards) + len(profile.loans)
+        consolidation_note = f"Consolida {account_count} cuentas en una sola obligación"
+        surplus_note = f"Consolida {account_count} cuentas"
+        surplus_budget = optimized_budget
+        surplus_payment = surplus_budget.quantize(TWOPLACES)
         for evaluation in eligibility.eligible_offers:
             offer = evaluation.offer
             term = offer.max_term_months
-            if profile.requested_term_months is not None:
-                term = min(profile.requested_term_months, offer.max_term_months)
+            if requested_term is not None:
+                term = min(requested_term, offer.max_term_months)
 
-            monthly_rate = (offer.new_rate_pct / Decimal("100")) / Decimal("12")
+            monthly_rate = offer.monthly_rate
             payment = self._amortized_payment(consolidated_balance, monthly_rate, term)
             total_paid = payment * term
             interest_cost = total_paid - consolidated_balance
             savings = (baseline_interest - interest_cost).quantize(TWOPLACES)
 
             notes = (
-                f"Consolida {len(profile.cards) + len(profile.loans)} cuentas en una sola obligación",
+                consolidation_note,
                 f"Oferta {offer.offer_id} con tasa {offer.new_rate_pct}% a {term} meses",
             )
-            if profile.requested_term_months and profile.requested_term_months > offer.max_term_months:
+            if requested_term and requested_term > offer.max_term_months:
                 notes += ("El plazo solicitado se ajusta al máximo permitido por la oferta",)
 
             results.append(
@@ -292,27 +346,29 @@ class ScenarioBuilder:
                 )
             )
 
-            surplus_budget = optimized_budget
             if surplus_budget > payment:
-                accel_months, accel_interest, accel_paid = self._simulate_single_loan(
-                    balance=consolidated_balance,
-                    monthly_rate=monthly_rate,
-                    monthly_payment=surplus_budget,
-                    max_months=offer.max_term_months,
-                )
+                accel_key = (monthly_rate, offer.max_term_months)
+                if accel_key not in accelerated:
+                    accelerated[accel_key] = self._simulate_single_loan(
+                        balance=consolidated_balance,
+                        monthly_rate=monthly_rate,
+                        monthly_payment=surplus_budget,
+                        max_months=offer.max_term_months,
+                    )
+                accel_months, accel_interest, accel_paid = accelerated[accel_key]
                 if accel_months is not None:
                     accel_savings = (baseline_interest - accel_interest).quantize(TWOPLACES)
                     base_interest = interest_cost
                     incremental_savings = (base_interest - accel_interest).quantize(TWOPLACES)
                     accel_notes = (
-                        f"Consolida {len(profile.cards) + len(profile.loans)} cuentas",
+                        surplus_note,
                         f"Oferta {offer.offer_id} aplicando excedente mensual",
                         f"Ahorro adicional vs consolidación base: {self._format_currency(incremental_savings)}",
                     )
                     results.append(
                         ScenarioResult(
                             scenario_type=ScenarioType.CONSOLIDATION_SURPLUS,
-                            monthly_payment=surplus_budget.quantize(TWOPLACES),
+                            monthly_payment=surplus_payment,
                             payoff_months=accel_months,
                             total_paid=accel_paid.quantize(TWOPLACES),
                             interest_cost=accel_interest.quantize(TWOPLACES),
@@ -335,24 +391,52 @@ class ScenarioBuilder:
         monthly_payment: Decimal,
         max_months: int,
     ) -> tuple[int | None, Decimal, Decimal]:
-        if monthly_payment <= ZERO:
+        """Return ``(payoff_month, total_interest, total_paid)`` for one loan at a fixed payment.
+
+        Totals are only meaningful when a payoff month is returned. Payments that cannot retire
+        the balance within the horizon even without interest are rejected up front with zero
+        totals, whereas the Decimal loop reports what was paid until it gave up.
+        """
+
+        # The annuity formula gives the payoff month of an unrounded schedule, but interest here
+        # is rounded to cents every month, so months and totals still come from the loop.
+        if monthly_payment <= ZERO or monthly_payment * (max_months * 2) < balance:
             return None, ZERO, ZERO
 
-        months = 0
+        balance_cents = _whole_cents(balance)
+        payment_cents = _whole_cents(monthly_payment)
+        rate = _exact_rate(monthly_rate)
+        if balance_cents is not None and payment_cents is not None and rate is not None:
+            horizon = max_months * 2
+            months, total_interest, total_paid = _amortize_cents(
+                balance_cents, rate, payment_cents, horizon, stop_on_stall=True
+            )
+            if months == horizon:
+                # The schedule only reports payoffs reached before its final month.
+                months = None
+            return months, _from_cents(total_interest), _from_cents(total_paid)
+        return ScenarioBuilder._simulate_single_loan_decimal(balance, monthly_rate, monthly_payment, max_months)
+
+    @staticmethod
+    def _simulate_single_loan_decimal(
+        balance: Decimal,
+        monthly_rate: Decimal,
+        monthly_payment: Decimal,
+        max_months: int,
+    ) -> tuple[int | None, Decimal, Decimal]:
         total_interest = ZERO
         total_paid = ZERO
         remaining = balance
 
-        for _ in range(max_months * 2):
+        # ``months_paid`` counts the payments made before this iteration.
+        for months_paid in range(max_months * 2):
             if remaining <= ZERO:
-                return months, total_interest, total_paid
-            months += 1
+                return months_paid, total_interest, total_paid
             interest = (remaining * monthly_rate).quantize(TWOPLACES)
             principal_payment = monthly_payment - interest
             if principal_payment <= ZERO:
                 return None, total_interest, total_paid
-            if principal_payment > remaining:
-                principal_payment = remaining
+            principal_payment = min(principal_payment, remaining)
             payment = interest + principal_payment
             total_interest += interest
             total_paid += payment
@@ -361,6 +445,7 @@ class ScenarioBuilder:
         return None, total_interest, total_paid
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _amortized_payment(balance: Decimal, monthly_rate: Decimal, term_months: int) -> Decimal:
         if term_months <= 0:
             raise ValueError("term_months must be positive")
@@ -368,6 +453,216 @@ class ScenarioBuilder:
             return ZERO
         if monthly_rate == ZERO:
             return (balance / Decimal(term_months)).quantize(TWOPLACES)
-        factor = (Decimal("1") + monthly_rate) ** term_months
-        payment = balance * monthly_rate * factor / (factor - Decimal("1"))
+        factor, factor_less_one = _growth_factor(monthly_rate, term_months)
+        payment = balance * monthly_rate * factor / factor_less_one
         return payment.quantize(TWOPLACES)
+
+
+@lru_cache(maxsize=1024)
+def _growth_factor(monthly_rate: Decimal, term_months: int) -> tuple[Decimal, Decimal]:
+    # Float pow is cheaper but can land on the other side of a half-cent boundary; the Decimal
+    # power depends only on rate and term, so it is shared by every balance on the same schedule.
+    factor = (ONE + monthly_rate) ** term_months
+    return factor, factor - ONE
+
+
+# Integer-cents payoff engine. Money in the simulation is always whole cents and monthly rates are
+# exact decimals, so every Decimal step can be reproduced with Python ints: interest is the
+# half-even rounding of ``balance_cents * numerator / denominator``, after the same 28-digit
+# rounding the Decimal context applies to the product. Results are identical to the Decimal loop
+# while avoiding a Decimal allocation per operation.
+
+
+def _whole_cents(value: Decimal) -> int | None:
+    if not value.is_finite():
+        return None
+    cents = value.scaleb(2)
+    integral = cents.to_integral_value()
+    if cents != integral:
+        return None
+    return int(integral)
+
+
+def _from_cents(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+def _exact_rate(rate: Decimal) -> tuple[int, int] | None:
+    """Return ``(numerator, denominator)`` with ``rate == numerator / denominator`` exactly."""
+
+    sign, digits, exponent = rate.as_tuple()
+    if sign or not isinstance(exponent, int):
+        return None
+    numerator = int("".join(map(str, digits)))
+    if exponent >= 0:
+        return numerator * 10**exponent, 1
+    return numerator, 10**-exponent
+
+
+def _round_half_even(numerator: int, denominator: int) -> int:
+    quotient, remainder = divmod(numerator, denominator)
+    doubled = remainder * 2
+    if doubled > denominator or (doubled == denominator and quotient & 1):
+        return quotient + 1
+    return quotient
+
+
+def _interest_cents(balance_cents: int, rate: tuple[int, int]) -> int:
+    """Cents of ``(balance * rate).quantize(TWOPLACES)`` under the module's Decimal context.
+
+    Interest posts in whole cents every month, so the rounding stays inside the loop: deferring it
+    to the reported totals would compound unrounded interest and change the results.
+    """
+
+    numerator, denominator = rate
+    product = balance_cents * numerator
+    if product >= _PRECISION_LIMIT:
+        scale = 10 ** (len(str(product)) - _PRECISION)
+        product = _round_half_even(product, scale) * scale
+    quotient, remainder = divmod(product, denominator)
+    doubled = remainder * 2
+    if doubled > denominator or (doubled == denominator and quotient & 1):
+        return quotient + 1
+    return quotient
+
+
+def _extra_payment_order(monthly_rates: Sequence[Decimal]) -> list[int]:
+    """Indices by descending rate; the stable sort keeps the first debt first among equal rates."""
+
+    return sorted(range(len(monthly_rates)), key=monthly_rates.__getitem__, reverse=True)
+
+
+def _payoff_inputs_in_cents(
+    debts: Sequence[_Debt], monthly_budget: Decimal
+) -> tuple[list[int], list[tuple[int, int]], list[int], list[int], int] | None:
+    budget = _whole_cents(monthly_budget)
+    if budget is None:
+        return None
+    balances: list[int] = []
+    rates: list[tuple[int, int]] = []
+    min_payments: list[int] = []
+    for debt in debts:
+        balance = debt.balance_cents
+        min_payment = debt.min_payment_cents
+        rate = debt.rate_ratio
+        if balance is None or min_payment is None or rate is None:
+            return None
+        balances.append(balance)
+        rates.append(rate)
+        min_payments.append(min_payment)
+    order = _extra_payment_order([debt.monthly_rate for debt in debts])
+    return balances, rates, order, min_payments, budget
+
+
+def _simulate_payoff_cents(
+    balances: list[int],
+    rates: list[tuple[int, int]],
+    order: list[int],
+    min_payments: list[int],
+    monthly_budget: int,
+    *,
+    max_months: int,
+) -> tuple[int | None, int, int]:
+    count = len(balances)
+    outstanding = sum(1 for balance in balances if balance > 0)
+    total_interest = 0
+    total_paid = 0
+    months = 0
+
+    for _ in range(max_months):
+        if not outstanding:
+            return months, total_interest, total_paid
+        if outstanding == 1:
+            # A lone debt receives min(balance, max(budget, min_payment)) every month, which is
+            # exactly a single loan at that payment for the rest of the horizon.
+            idx = next(idx for idx in range(count) if balances[idx] > 0)
+            payment = max(monthly_budget, min_payments[idx])
+            tail_months, tail_interest, tail_paid = _amortize_cents(
+                balances[idx], rates[idx], payment, max_months - months, stop_on_stall=False
+            )
+            total_interest += tail_interest
+            total_paid += tail_paid
+            if tail_months is None:
+                return None, total_interest, total_paid
+            return months + tail_months, total_interest, total_paid
+
+        months += 1
+        month_interest = 0
+        payments = [0] * count
+        required_payment = 0
+        for idx in range(count):
+            balance = balances[idx]
+            if balance <= 0:
+                continue
+            interest = _interest_cents(balance, rates[idx])
+            balance += interest
+            balances[idx] = balance
+            month_interest += interest
+            if balance > 0:
+                payment = min(min_payments[idx], balance)
+                payments[idx] = payment
+                required_payment += payment
+
+        budget = max(monthly_budget, required_payment)
+
+        extra = budget - required_payment
+        for idx in order:
+            if extra <= 0:
+                break
+            balance = balances[idx]
+            if balance <= 0:
+                continue
+            remaining = balance - payments[idx]
+            if remaining <= 0:
+                continue
+            add_payment = min(extra, remaining)
+            payments[idx] += add_payment
+            extra -= add_payment
+
+        month_paid = 0
+        outstanding = 0
+        for idx in range(count):
+            balance = balances[idx]
+            if balance <= 0:
+                continue
+            actual_payment = min(payments[idx], balance)
+            balance -= actual_payment
+            balances[idx] = balance
+            month_paid += actual_payment
+            if balance > 0:
+                outstanding += 1
+
+        total_interest += month_interest
+        total_paid += month_paid
+
+        if not outstanding:
+            return months, total_interest, total_paid
+
+    return None, total_interest, total_paid
+
+
+def _amortize_cents(
+    balance: int, rate: tuple[int, int], monthly_payment: int, horizon: int, *, stop_on_stall: bool
+) -> tuple[int | None, int, int]:
+    """Pay ``monthly_payment`` against one balance until it is retired or ``horizon`` months pass.
+
+    With ``stop_on_stall`` a payment that does not reach principal ends the schedule without a
+    payoff month; otherwise the balance keeps accruing until the horizon, as in the multi-debt loop.
+    """
+
+    if balance <= 0:
+        return 0, 0, 0
+    total_interest = 0
+    total_paid = 0
+    for month in range(1, horizon + 1):
+        interest = _interest_cents(balance, rate)
+        principal_payment = monthly_payment - interest
+        if principal_payment <= 0 and stop_on_stall:
+            return None, total_interest, total_paid
+        principal_payment = min(principal_payment, balance)
+        total_interest += interest
+        total_paid += interest + principal_payment
+        balance -= principal_payment
+        if balance <= 0:
+            return month, total_interest, total_paid
+    return None, total_interest, total_paid
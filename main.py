@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import api_router
+from app.api.deps import (
+    close_openai_client,
+    get_batch_poller,
+    get_openai_client,
+    get_report_generator,
+    get_repository,
+    get_scenario_builder,
+)
+from app.core.config import get_settings
 from app.core.logging import configure_logging, get_logger
 
 configure_logging()
@@ -13,8 +23,25 @@ logger = get_logger(__name__)
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
+    # Parse the datasets and build profiles and offers before serving, not on the first evaluation.
+    customers = get_repository().preload()
+    get_scenario_builder()
+    logger.info("Loaded %d customer profiles", customers)
+    if get_settings().azure_gpt5_endpoint:
+        # Pay the TLS/ALPN handshake at startup instead of on the first report request.
+        try:
+            await get_openai_client().warmup()
+        except RuntimeError as exc:
+            logger.warning("Skipping Azure OpenAI warmup: %s", exc)
+    # Deferred report batches are collected in the background; the generator (and its Azure
+    # settings) is only built once a batch has been submitted.
+    poller_task = asyncio.create_task(get_batch_poller().run(get_report_generator))
     logger.info("FastAPI application started")
     yield
+    poller_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await poller_task
+    await close_openai_client()
 
 
 app = FastAPI(title="Fin Restructure Assistant", lifespan=lifespan)
@@ -0,0 +1,14 @@
+import pytest
+
+from app.core.config import get_settings
+
+
+@pytest.fixture
+def azure_env(monkeypatch):
+    monkeypatch.setenv("AZURE_GPT5_ENDPOINT", "https://example.openai.azure.com/")
+    monkeypatch.setenv("AZURE_GPT5_API_KEY", "secret")
+    monkeypatch.setenv("AZURE_MODEL_NAME_DEPLOYMENT", "gpt-5")
+    monkeypatch.setenv("AZURE_OPENAI_API_VERSION", "2025-01-01")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
@@ -0,0 +1,73 @@
+import asyncio
+
+import httpx
+
+from app.ai.batch_poller import ReportBatchPoller
+from app.models import ReportBatchJob
+
+JOB = ReportBatchJob(batch_id="batch-1", customer_ids_by_run={"rpt_1": "CU-001"})
+
+
+class StubGenerator:
+    def __init__(self, *outcomes) -> None:
+        self._outcomes = list(outcomes)
+        self.polled: list[str] = []
+
+    async def complete_batched(self, job: ReportBatchJob):
+        self.polled.append(job.batch_id)
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_poll_once_keeps_running_batches_and_stores_finished_ones():
+    poller = ReportBatchPoller()
+    poller.track(JOB)
+    generator = StubGenerator(None, ["report"])
+
+    asyncio.run(poller.poll_once(generator))
+    assert poller.is_pending("batch-1")
+    assert poller.results("batch-1") is None
+
+    asyncio.run(poller.poll_once(generator))
+    assert not poller.is_pending("batch-1")
+    assert poller.results("batch-1") == ["report"]
+    assert generator.polled == ["batch-1", "batch-1"]
+
+
+def test_poll_once_retries_transport_errors_and_drops_failed_batches():
+    poller = ReportBatchPoller()
+    poller.track(JOB)
+    generator = StubGenerator(
+        httpx.ConnectError("unreachable"),
+        RuntimeError("batch ended with status failed"),
+    )
+
+    asyncio.run(poller.poll_once(generator))
+    assert poller.is_pending("batch-1")
+
+    asyncio.run(poller.poll_once(generator))
+    assert not poller.is_pending("batch-1")
+    assert poller.results("batch-1") is None
+
+
+def test_run_only_builds_the_generator_once_a_batch_is_pending():
+    poller = ReportBatchPoller()
+    built: list[StubGenerator] = []
+
+    def factory() -> StubGenerator:
+        built.append(StubGenerator(["report"]))
+        return built[-1]
+
+    async def run_ticks() -> None:
+        task = asyncio.create_task(poller.run(factory, interval_seconds=0))
+        await asyncio.sleep(0.01)
+        assert built == []
+        poller.track(JOB)
+        while poller.is_pending("batch-1"):
+            await asyncio.sleep(0)
+        task.cancel()
+
+    asyncio.run(run_ticks())
+    assert poller.results("batch-1") == ["report"]
@@ -0,0 +1,162 @@
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from app.ai.openai_client import AzureOpenAIClient
+
+
+def _build_client(handler) -> AzureOpenAIClient:
+    return AzureOpenAIClient(
+        retry_backoff_seconds=0, transport=httpx.MockTransport(handler)
+    )
+
+
+def _completion(content: str) -> dict:
+    return {"choices": [{"message": {"content": content}}]}
+
+
+def test_chat_completion_retries_throttled_requests(azure_env):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"retry-after": "0"})
+        return httpx.Response(200, json=_completion("Resumen ejecutivo:"))
+
+    client = _build_client(handler)
+    content = asyncio.run(client.chat_completion([{"role": "user", "content": "hola"}]))
+
+    assert content == "Resumen ejecutivo:"
+    assert len(calls) == 2
+    assert calls[-1].url.path == "/openai/deployments/gpt-5/chat/completions"
+    assert calls[-1].url.params["api-version"] == "2025-01-01"
+    assert calls[-1].headers["api-key"] == "secret"
+
+
+def test_batch_submission_and_polling(azure_env):
+    uploaded: list[bytes] = []
+    output_lines = [
+        {
+            "custom_id": "rpt_1",
+            "response": {"status_code": 200, "body": _completion("texto 1")},
+        },
+        {"custom_id": "rpt_2", "response": {"status_code": 500, "body": {}}},
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/openai/files":
+            uploaded.append(request.content)
+            return httpx.Response(200, json={"id": "file-in"})
+        if path == "/openai/batches":
+            assert orjson.loads(request.content)["input_file_id"] == "file-in"
+            return httpx.Response(200, json={"id": "batch-1"})
+        if path == "/openai/batches/batch-1":
+            return httpx.Response(
+                200, json={"status": "completed", "output_file_id": "file-out"}
+            )
+        if path == "/openai/files/file-out/content":
+            return httpx.Response(
+                200, content=b"\n".join(orjson.dumps(line) for line in output_lines)
+            )
+        return httpx.Response(404)
+
+    client = _build_client(handler)
+    messages = [{"role": "user", "content": "hola"}]
+    batch_id = asyncio.run(
+        client.submit_batch([("rpt_1", messages), ("rpt_2", messages)])
+    )
+    results = asyncio.run(client.poll_batch(batch_id))
+
+    assert batch_id == "batch-1"
+    assert b'"custom_id":"rpt_1"' in uploaded[0]
+    assert results == {"rpt_1": "texto 1"}
+
+
+def test_poll_batch_returns_none_while_running(azure_env):
+    client = _build_client(
+        lambda request: httpx.Response(200, json={"status": "in_progress"})
+    )
+
+    assert asyncio.run(client.poll_batch("batch-1")) is None
+
+
+def test_poll_batch_returns_empty_results_without_output_file(azure_env):
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        return httpx.Response(
+            200,
+            json={
+                "status": "completed",
+                "output_file_id": None,
+                "error_file_id": "file-err",
+            },
+        )
+
+    client = _build_client(handler)
+
+    assert asyncio.run(client.poll_batch("batch-1")) == {}
+    assert requested == ["/openai/batches/batch-1"]
+
+
+def test_submit_batch_does_not_retry_job_creation_on_server_errors(azure_env):
+    creations = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/openai/files":
+            return httpx.Response(200, json={"id": "file-in"})
+        creations.append(request)
+        if len(creations) == 1:
+            return httpx.Response(429, headers={"retry-after": "0"})
+        return httpx.Response(503)
+
+    client = _build_client(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(
+            client.submit_batch([("rpt_1", [{"role": "user", "content": "hola"}])])
+        )
+    assert len(creations) == 2
+
+
+def test_warmup_ignores_status_and_transport_errors(azure_env):
+    def not_found(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404)
+
+    def unreachable(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("unreachable", request=request)
+
+    asyncio.run(_build_client(not_found).warmup())
+    asyncio.run(_build_client(unreachable).warmup())
+
+
+def test_chat_completion_stream_yields_content_deltas(azure_env):
+    events = [
+        {"choices": [], "prompt_filter_results": []},
+        {"choices": [{"delta": {"role": "assistant"}}]},
+        {"choices": [{"delta": {"content": "Resumen "}}]},
+        {"choices": [{"delta": {"content": "ejecutivo:"}}]},
+    ]
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(orjson.loads(request.content))
+        body = b"".join(b"data: " + orjson.dumps(event) + b"\n\n" for event in events)
+        return httpx.Response(200, content=body + b"data: [DONE]\n\n")
+
+    async def collect() -> list[str]:
+        client = _build_client(handler)
+        return [
+            delta
+            async for delta in client.chat_completion_stream(
+                [{"role": "user", "content": "hola"}]
+            )
+        ]
+
+    assert asyncio.run(collect()) == ["Resumen ", "ejecutivo:"]
+    assert requests[0]["stream"] is True
@@ -0,0 +1,203 @@
+import asyncio
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import httpx
+import orjson
+import pytest
+
+from app.ai.openai_client import AzureOpenAIClient
+from app.ai.report_generator import ReportGenerator, _escape_note, _NarrativeParser
+from app.models import ReportBatchJob
+from app.services import DataRepository, DebtConsolidationAnalyzer, ScenarioBuilder
+from app.services.report_storage import UploadResult
+
+NARRATIVE = """Resumen ejecutivo:
+- La deuda total supera los ingresos disponibles
+- Conviene priorizar la tarjeta con mayor tasa
+
+PUNTOS CLAVE POR ESCENARIO:
+- Escenario 1 – pago mínimo extiende el plazo
+Escenario 2 reduce intereses
+
+Recomendaciones y riesgos:
+- Mantener un fondo de emergencia
+– Revisar la tasa antes de firmar
+"""
+
+
+def _build_generator() -> ReportGenerator:
+    # Parsing does not touch Azure clients, so skip __init__.
+    return ReportGenerator.__new__(ReportGenerator)
+
+
+def test_parse_narrative_splits_sections_and_strips_bullets():
+    sections = _build_generator()._parse_narrative(NARRATIVE)
+
+    assert sections["summary"] == [
+        "La deuda total supera los ingresos disponibles",
+        "Conviene priorizar la tarjeta con mayor tasa",
+    ]
+    assert sections["scenarios"] == [
+        "Escenario 1 - pago mínimo extiende el plazo",
+        "Escenario 2 reduce intereses",
+    ]
+    assert sections["risks"] == [
+        "Mantener un fondo de emergencia",
+        "Revisar la tasa antes de firmar",
+    ]
+
+
+def test_parse_narrative_falls_back_when_sections_missing():
+    sections = _build_generator()._parse_narrative("Texto libre sin encabezados")
+
+    assert sections["summary"] == ["Texto libre sin encabezados"]
+    assert sections["scenarios"] == ["Ver detalle numérico en la sección inferior."]
+    assert sections["risks"] == [
+        "Revise los supuestos de ingreso y variabilidad antes de avanzar."
+    ]
+
+
+def test_narrative_parser_matches_full_parse_when_fed_in_chunks():
+    parser = _NarrativeParser()
+    for start in range(0, len(NARRATIVE), 7):
+        parser.feed(NARRATIVE[start : start + 7])
+
+    assert parser.close() == _build_generator()._parse_narrative(NARRATIVE)
+
+
+def test_sanitize_normalizes_typographic_characters():
+    text = "Plan – ahorro “rápido” • tasa 17,5% anual"
+
+    assert (
+        ReportGenerator._sanitize(text) == 'Plan - ahorro "rápido" · tasa 17,5% anual'
+    )
+
+
+def test_escape_note_sanitizes_and_escapes_once():
+    escaped = _escape_note("Tasa <18% – revisar")
+
+    assert escaped == "Tasa &lt;18% - revisar"
+    assert escaped.__html__() == escaped
+
+
+def test_generate_many_cancels_pending_reports_when_one_fails():
+    cancelled: list[str] = []
+
+    class FailingGenerator(ReportGenerator):
+        async def generate(self, customer_id: str):
+            if customer_id == "CU-BAD":
+                raise KeyError(customer_id)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(customer_id)
+                raise
+
+    generator = FailingGenerator.__new__(FailingGenerator)
+
+    with pytest.raises(KeyError):
+        asyncio.run(generator.generate_many(["CU-001", "CU-BAD", "CU-002"]))
+    assert sorted(cancelled) == ["CU-001", "CU-002"]
+
+
+def test_format_currency_ignores_sign_of_zero_regardless_of_call_order():
+    assert ReportGenerator._format_currency(Decimal("-0.00")) == "S/. 0.00"
+    assert ReportGenerator._format_currency(Decimal("0.00")) == "S/. 0.00"
+    assert ReportGenerator._format_currency("-1234.5") == "S/. -1,234.50"
+
+
+class StubStorage:
+    def __init__(self) -> None:
+        self.uploads: list[tuple[str, str]] = []
+
+    def upload(
+        self, *, customer_id: str, data: bytes, run_id: str | None = None
+    ) -> UploadResult:
+        self.uploads.append((customer_id, run_id))
+        return UploadResult(
+            blob_path=f"{customer_id}/{run_id}/report.pdf",
+            run_id=run_id,
+            url=f"https://example.com/{run_id}.pdf",
+            generated_at=datetime(2025, 10, 23, 12, 0, tzinfo=UTC),
+        )
+
+
+def _build_batch_generator(handler) -> ReportGenerator:
+    client = AzureOpenAIClient(
+        retry_backoff_seconds=0, transport=httpx.MockTransport(handler)
+    )
+    repo = DataRepository()
+    generator = _build_generator()
+    generator._scenario_builder = ScenarioBuilder(
+        repo, DebtConsolidationAnalyzer(repo.offers)
+    )
+    generator._openai_client = client
+    generator._storage = StubStorage()
+    # PDF rendering needs WeasyPrint's native libraries; the batch flow only cares that it runs.
+    generator._render_pdf = lambda *args, **kwargs: b"%PDF"
+    return generator
+
+
+def test_submit_batched_uses_run_ids_as_custom_ids(azure_env):
+    uploaded: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/openai/files":
+            uploaded.append(request.content)
+            return httpx.Response(200, json={"id": "file-in"})
+        return httpx.Response(200, json={"id": "batch-1"})
+
+    generator = _build_batch_generator(handler)
+    job = asyncio.run(generator.submit_batched(["CU-001", "CU-002"]))
+
+    assert job.batch_id == "batch-1"
+    assert sorted(job.customer_ids_by_run.values()) == ["CU-001", "CU-002"]
+    for run_id in job.customer_ids_by_run:
+        assert f'"custom_id":"{run_id}"'.encode() in uploaded[0]
+
+
+def test_complete_batched_returns_none_while_batch_runs(azure_env):
+    generator = _build_batch_generator(
+        lambda request: httpx.Response(200, json={"status": "in_progress"})
+    )
+    job = ReportBatchJob(batch_id="batch-1", customer_ids_by_run={"rpt_1": "CU-001"})
+
+    assert asyncio.run(generator.complete_batched(job)) is None
+    assert generator._storage.uploads == []
+
+
+def test_complete_batched_requests_missing_narratives_interactively(azure_env):
+    streamed = []
+    completion = {"choices": [{"message": {"content": "Resumen ejecutivo:\n- lote"}}]}
+    output = {
+        "custom_id": "rpt_1",
+        "response": {"status_code": 200, "body": completion},
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/openai/batches/batch-1":
+            return httpx.Response(
+                200, json={"status": "completed", "output_file_id": "file-out"}
+            )
+        if path == "/openai/files/file-out/content":
+            return httpx.Response(200, content=orjson.dumps(output))
+        streamed.append(orjson.loads(request.content))
+        event = {"choices": [{"delta": {"content": "Resumen ejecutivo:\n- directo"}}]}
+        return httpx.Response(
+            200, content=b"data: " + orjson.dumps(event) + b"\n\ndata: [DONE]\n\n"
+        )
+
+    generator = _build_batch_generator(handler)
+    job = ReportBatchJob(
+        batch_id="batch-1", customer_ids_by_run={"rpt_1": "CU-001", "rpt_2": "CU-002"}
+    )
+    results = asyncio.run(generator.complete_batched(job))
+
+    assert [(r.customer_id, r.run_id, r.narrative) for r in results] == [
+        ("CU-001", "rpt_1", "Resumen ejecutivo:\n- lote"),
+        ("CU-002", "rpt_2", "Resumen ejecutivo:\n- directo"),
+    ]
+    assert len(streamed) == 1 and streamed[0]["stream"] is True
+    assert generator._storage.uploads == [("CU-001", "rpt_1"), ("CU-002", "rpt_2")]
@@ -57,3 +57,12 @@ def test_evaluation_endpoint_rejects_missing_key():
         json={"customer_id": "CU-001"},
     )
     assert response.status_code == 401
+
+
+def test_evaluation_endpoint_rejects_wrong_key():
+    response = client.post(
+        "/v1/evaluation",
+        json={"customer_id": "CU-001"},
+        headers={"X-API-Key": "test-kez"},
+    )
+    assert response.status_code == 401
@@ -1,9 +1,17 @@
+import asyncio
 from datetime import datetime, timezone
 
 from fastapi.testclient import TestClient
 
-from app.api.deps import get_report_generator
-from app.models import ScenarioSummary
+from app.ai.batch_poller import ReportBatchPoller
+from app.api.deps import (
+    close_openai_client,
+    get_batch_poller,
+    get_openai_client,
+    get_report_generator,
+)
+from app.core.config import get_settings
+from app.models import ReportBatchJob, ScenarioSummary
 from app.models.report import ReportResult
 from main import app
 
@@ -22,6 +30,23 @@ class StubReportGenerator:
             summary=ScenarioSummary(eligibility=None, scenarios=()),  # type: ignore[arg-type]
         )
 
+    async def generate_many(self, customer_ids: list[str]) -> list[ReportResult]:
+        return [await self.generate(customer_id) for customer_id in customer_ids]
+
+    async def submit_batched(self, customer_ids: list[str]) -> ReportBatchJob:
+        return ReportBatchJob(
+            batch_id="batch-stub",
+            customer_ids_by_run={
+                f"rpt_{i}": customer_id for i, customer_id in enumerate(customer_ids)
+            },
+        )
+
+    async def complete_batched(self, job: ReportBatchJob) -> list[ReportResult]:
+        return [
+            await self.generate(customer_id)
+            for customer_id in job.customer_ids_by_run.values()
+        ]
+
 
 def test_report_endpoint_returns_payload(monkeypatch):
     monkeypatch.setenv("API_KEY", "test-key")
@@ -37,3 +62,87 @@ def test_report_endpoint_returns_payload(monkeypatch):
     assert payload["customer_id"] == "CU-001"
     assert payload["run_id"] == "rpt_stub"
     assert payload["report_url"] == "https://example.com/report.pdf"
+
+
+def test_report_batch_endpoint_returns_reports_in_request_order(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    app.dependency_overrides[get_report_generator] = lambda: StubReportGenerator()
+    response = client.post(
+        "/v1/report/batch",
+        json={"customer_ids": ["CU-002", "CU-001"]},
+        headers={"X-API-Key": "test-key"},
+    )
+    app.dependency_overrides.pop(get_report_generator, None)
+    assert response.status_code == 200
+    payload = response.json()
+    assert [item["customer_id"] for item in payload["reports"]] == ["CU-002", "CU-001"]
+    assert all(
+        item["report_url"] == "https://example.com/report.pdf"
+        for item in payload["reports"]
+    )
+
+
+def test_report_batch_endpoint_rejects_empty_batch(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    app.dependency_overrides[get_report_generator] = lambda: StubReportGenerator()
+    response = client.post(
+        "/v1/report/batch",
+        json={"customer_ids": []},
+        headers={"X-API-Key": "test-key"},
+    )
+    app.dependency_overrides.pop(get_report_generator, None)
+    assert response.status_code == 422
+
+
+def test_report_batch_deferred_mode_queues_a_job_that_can_be_collected(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    generator = StubReportGenerator()
+    poller = ReportBatchPoller()
+    app.dependency_overrides[get_report_generator] = lambda: generator
+    app.dependency_overrides[get_batch_poller] = lambda: poller
+    headers = {"X-API-Key": "test-key"}
+
+    submitted = client.post(
+        "/v1/report/batch?mode=deferred",
+        json={"customer_ids": ["CU-002", "CU-001"]},
+        headers=headers,
+    )
+    pending = client.get("/v1/report/batch/batch-stub", headers=headers)
+    asyncio.run(poller.poll_once(generator))
+    completed = client.get("/v1/report/batch/batch-stub", headers=headers)
+    missing = client.get("/v1/report/batch/batch-unknown", headers=headers)
+    app.dependency_overrides.pop(get_report_generator, None)
+    app.dependency_overrides.pop(get_batch_poller, None)
+
+    assert submitted.status_code == 202
+    assert submitted.json() == {
+        "batch_id": "batch-stub",
+        "status": "pending",
+        "reports": [],
+    }
+    assert pending.json()["status"] == "pending"
+    assert completed.status_code == 200
+    assert completed.json()["status"] == "completed"
+    assert [item["customer_id"] for item in completed.json()["reports"]] == [
+        "CU-002",
+        "CU-001",
+    ]
+    assert missing.status_code == 404
+
+
+def test_close_openai_client_discards_the_closed_client(monkeypatch):
+    monkeypatch.setenv("AZURE_GPT5_ENDPOINT", "https://example.openai.azure.com/")
+    monkeypatch.setenv("AZURE_GPT5_API_KEY", "secret")
+    monkeypatch.setenv("AZURE_MODEL_NAME_DEPLOYMENT", "gpt-5")
+    monkeypatch.setenv("AZURE_OPENAI_API_VERSION", "2025-01-01")
+    get_settings.cache_clear()
+    first = get_openai_client()
+
+    asyncio.run(close_openai_client())
+    cached_after_close = get_openai_client.cache_info().currsize
+    second = get_openai_client()
+    asyncio.run(close_openai_client())
+    get_settings.cache_clear()
+
+    assert cached_after_close == 0
+    assert second is not first
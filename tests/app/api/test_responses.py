@@ -0,0 +1,10 @@
+from app.api.responses import OrjsonResponse
+
+
+def test_orjson_response_renders_compact_json():
+    response = OrjsonResponse(
+        {"customer_id": "CU-001", "balance": "21500.00", "offers": []}
+    )
+
+    assert response.body == b'{"customer_id":"CU-001","balance":"21500.00","offers":[]}'
+    assert response.headers["content-type"] == "application/json"
@@ -1,19 +1,10 @@
 from decimal import Decimal
 
 from app.models import ScenarioType
-from app.services import DataRepository, DebtConsolidationAnalyzer, ScenarioBuilder
 
 
-def _build_builder() -> ScenarioBuilder:
-    repo = DataRepository()
-    analyzer = DebtConsolidationAnalyzer(repo.offers)
-    return ScenarioBuilder(repo, analyzer)
-
-
-def test_scenario_builder_generates_all_scenarios_for_primary_customer():
-    builder = _build_builder()
-
-    profile, summary = builder.build_summary("CU-001")
+def test_scenario_builder_generates_all_scenarios_for_primary_customer(scenario_builder):
+    profile, summary = scenario_builder.build_summary("CU-001")
 
     assert profile.customer_id == "CU-001"
     assert summary.eligibility.is_eligible is True
@@ -41,19 +32,17 @@ def test_scenario_builder_generates_all_scenarios_for_primary_customer():
         s for s in surplus_consolidations if s.consolidation_offer_id == "OF-CONSO-36M"
     )
 
-    assert minimum.monthly_payment > Decimal("0")
+    assert minimum.monthly_payment > Decimal(0)
     assert optimized.savings_vs_minimum is not None
-    assert optimized.savings_vs_minimum >= Decimal("0")
+    assert optimized.savings_vs_minimum >= Decimal(0)
     assert all(c.savings_vs_minimum is not None for c in consolidations)
     assert all(c.savings_vs_minimum is not None for c in surplus_consolidations)
     assert top_offer.payoff_months == 36
     assert surplus_for_top.payoff_months < top_offer.payoff_months
 
 
-def test_consolidation_scenario_absent_for_ineligible_customer():
-    builder = _build_builder()
-
-    profile, summary = builder.build_summary("CU-002")
+def test_consolidation_scenario_absent_for_ineligible_customer(scenario_builder):
+    profile, summary = scenario_builder.build_summary("CU-002")
 
     assert summary.eligibility.is_eligible is True
     consolidation = [s for s in summary.scenarios if s.scenario_type is ScenarioType.CONSOLIDATION]
@@ -65,3 +54,13 @@ def test_consolidation_scenario_absent_for_ineligible_customer():
     assert consolidation[0].savings_vs_minimum is not None
     assert surplus[0].savings_vs_minimum is not None
     assert surplus[0].payoff_months < consolidation[0].payoff_months
+
+
+def test_build_summary_reuses_results_per_customer_and_term(scenario_builder):
+    first = scenario_builder.build_summary("CU-001")
+    again = scenario_builder.build_summary(customer_id="CU-001")
+    other_term = scenario_builder.build_summary("CU-001", 12)
+
+    assert again is first
+    assert other_term is not first
+    assert other_term[0].requested_term_months == 12
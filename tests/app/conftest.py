@@ -0,0 +1,10 @@
+import pytest
+
+from app.services import DataRepository, DebtConsolidationAnalyzer, ScenarioBuilder
+
+
+@pytest.fixture
+def scenario_builder() -> ScenarioBuilder:
+    repo = DataRepository()
+    analyzer = DebtConsolidationAnalyzer(repo.offers)
+    return ScenarioBuilder(repo, analyzer)
@@ -1,6 +1,7 @@
+from dataclasses import replace
 from decimal import Decimal
 
-from app.models import ProductType
+from app.models import CustomerProfile, ProductType, RiskIndicators
 from app.services import DataRepository, DebtConsolidationAnalyzer
 
 
@@ -42,3 +43,78 @@ def test_analyzer_with_real_customer_data():
 
     assert [evaluation.offer.offer_id for evaluation in other_result.eligible_offers] == ["OF-CONSO-24M"]
     assert [evaluation.offer.offer_id for evaluation in other_result.rejected_offers] == ["OF-CONSO-36M"]
+
+
+def test_repository_tolerates_padded_csv_fields(tmp_path):
+    (tmp_path / "cards.csv").write_text(
+        "card_id,customer_id,balance,annual_rate_pct,min_payment_pct,payment_due_day,days_past_due\n"
+        " C-1 , CU-9 , 100.50 ,45.0,5.0, 15 ,0\n\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "loans.csv").write_text(
+        "loan_id,customer_id,product_type,principal,annual_rate_pct,remaining_term_months,collateral,days_past_due\n"
+        "L-1,CU-9, micro ,200.00,35.0,24, true ,3\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "credit_score_history.csv").write_text(
+        "customer_id,date,credit_score\n CU-9 , 2025-10-01 , 700\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "customer_cashflow.csv").write_text(
+        "customer_id,monthly_income_avg,income_variability_pct,essential_expenses_avg\n CU-9 ,3000.00,10.0,1500.00\n",
+        encoding="utf-8",
+    )
+
+    profile = DataRepository(tmp_path).build_customer_profile("CU-9")
+
+    assert [card.account_id for card in profile.cards] == ["C-1"]
+    assert profile.loans[0].product_type is ProductType.MICRO
+    assert profile.loans[0].collateral is True
+    assert profile.consolidated_balance == Decimal("300.50")
+    assert profile.cashflow is not None
+    assert profile.risk_indicators.latest_credit_score == 700
+
+
+def test_repository_reuses_cached_profiles():
+    repo = DataRepository()
+
+    profile = repo.build_customer_profile("CU-001")
+    with_term = repo.build_customer_profile("CU-001", requested_term_months=24)
+
+    assert repo.build_customer_profile("CU-001") is profile
+    assert with_term.requested_term_months == 24
+    assert with_term.cards == profile.cards
+    assert repo.build_customer_profile("CU-404").consolidated_balance == Decimal(0)
+
+
+def test_seeded_risk_indicators_stay_out_of_profile_fields():
+    repo = DataRepository()
+    profile = repo.build_customer_profile("CU-001")
+    fresh = CustomerProfile(
+        customer_id=profile.customer_id,
+        cards=profile.cards,
+        loans=profile.loans,
+        cashflow=profile.cashflow,
+        credit_history=profile.credit_history,
+    )
+
+    assert profile == fresh
+    assert repr(profile) == repr(fresh)
+    assert replace(profile, cards=()).risk_indicators == replace(fresh, cards=()).risk_indicators
+
+
+def test_with_risk_indicators_uses_the_given_indicators():
+    risk = RiskIndicators(
+        latest_credit_score=650, credit_score_date=None, max_days_past_due=5, has_active_delinquency=True
+    )
+
+    profile = CustomerProfile.with_risk_indicators(risk, customer_id="CU-9")
+
+    assert profile.risk_indicators is risk
+    assert profile == CustomerProfile(customer_id="CU-9")
+
+
+def test_preload_builds_every_profile():
+    repo = DataRepository()
+
+    assert repo.preload() == len(repo.profiles) > 0
@@ -1,3 +1,6 @@
+from decimal import Decimal
+
+from app.models import ProductType
 from app.models.offer import Offer
 
 
@@ -18,3 +21,32 @@ def test_offer_rule_config_parses_min_score_and_delinquency():
     assert rules.min_credit_score == 650
     assert rules.disallow_active_delinquencies is True
     assert rules.notes is not None and "mora" in rules.notes.lower()
+
+
+def test_offer_precomputes_eligible_type_mask():
+    offer = Offer.from_dict(
+        {
+            "offer_id": "OF-TEST-36M",
+            "product_types_eligible": ["card", "micro"],
+            "max_consolidated_balance": 25000,
+            "new_rate_pct": 15.0,
+            "max_term_months": 36,
+        }
+    )
+
+    assert offer.eligible_type_mask == ProductType.CARD.bit | ProductType.MICRO.bit
+    assert offer.eligible_type_mask & ProductType.PERSONAL.bit == 0
+
+
+def test_offer_precomputes_monthly_rate():
+    offer = Offer.from_dict(
+        {
+            "offer_id": "OF-TEST-12M",
+            "product_types_eligible": ["personal"],
+            "max_consolidated_balance": 10000,
+            "new_rate_pct": 18,
+            "max_term_months": 12,
+        }
+    )
+
+    assert offer.monthly_rate == Decimal(18) / Decimal(100) / Decimal(12)
@@ -0,0 +1,113 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from app.services import ScenarioBuilder
+from app.services.scenario_builder import (
+    _Debt,
+    _interest_cents,
+    _payoff_inputs_in_cents,
+)
+
+
+def _random_debts(rng: random.Random) -> list[_Debt]:
+    debts = []
+    for idx in range(rng.randint(1, 4)):
+        balance = Decimal(rng.randint(0, 5_000_000)) / 100
+        monthly_rate = (
+            Decimal(rng.choice(["0", "9.9", "18.5", "29.99", "45", "120"]))
+            / Decimal(100)
+            / Decimal(12)
+        )
+        min_payment = Decimal(rng.randint(0, 60_000)) / 100
+        debts.append(_Debt(f"debt-{idx}", balance, monthly_rate, min_payment))
+    return debts
+
+
+def test_cents_engine_matches_decimal_engine(scenario_builder):
+    rng = random.Random(20240601)
+
+    for _ in range(200):
+        debts = _random_debts(rng)
+        budget = Decimal(rng.randint(0, 300_000)) / 100
+        assert _payoff_inputs_in_cents(debts, budget) is not None
+
+        expected = scenario_builder._simulate_payoff_decimal(debts, budget, 240)
+        assert scenario_builder._simulate_payoff(debts, budget, 240) == expected
+
+
+def test_interest_cents_applies_context_rounding_to_large_products():
+    balance = Decimal("98765432109.87")
+    rate = Decimal("29.99") / Decimal(100) / Decimal(12)
+    inputs = _payoff_inputs_in_cents(
+        [_Debt("card", balance, rate, Decimal("1.00"))], Decimal("1.00")
+    )
+    assert inputs is not None
+
+    expected = (balance * rate).quantize(Decimal("0.01"))
+    assert Decimal(_interest_cents(inputs[0][0], inputs[1][0])) / 100 == expected
+
+
+def test_sub_cent_balances_use_decimal_engine(scenario_builder):
+    debts = [_Debt("card", Decimal("1000.005"), Decimal("0.015"), Decimal("50.00"))]
+
+    assert _payoff_inputs_in_cents(debts, Decimal("100.00")) is None
+    assert scenario_builder._simulate_payoff(
+        debts, Decimal("100.00")
+    ) == scenario_builder._simulate_payoff_decimal(debts, Decimal("100.00"), 600)
+
+
+def test_single_loan_cents_engine_matches_decimal_engine():
+    rng = random.Random(7)
+
+    for _ in range(200):
+        balance = Decimal(rng.randint(1, 5_000_000)) / 100
+        monthly_rate = (
+            Decimal(rng.choice(["0", "8.5", "14.99", "33"]))
+            / Decimal(100)
+            / Decimal(12)
+        )
+        payment = Decimal(rng.randint(1, 200_000)) / 100
+
+        expected = ScenarioBuilder._simulate_single_loan_decimal(
+            balance, monthly_rate, payment, 36
+        )
+        result = ScenarioBuilder._simulate_single_loan(
+            balance, monthly_rate, payment, 36
+        )
+        assert result[0] == expected[0]
+        if expected[0] is not None:
+            assert result == expected
+
+
+def test_single_loan_rejects_payments_that_cannot_cover_the_balance():
+    args = (Decimal("10000.00"), Decimal("0.005"), Decimal("100.00"), 48)
+
+    result = ScenarioBuilder._simulate_single_loan(*args)
+    reference = ScenarioBuilder._simulate_single_loan_decimal(*args)
+
+    # Both engines agree there is no payoff; only the Decimal loop reports the partial totals.
+    assert result == (None, Decimal(0), Decimal(0))
+    assert reference[0] is None
+    assert reference[2] > 0
+
+
+@pytest.fixture
+def empty_payment_cache():
+    # _amortized_payment is a process-wide lru_cache; start from a known state.
+    ScenarioBuilder._amortized_payment.cache_clear()
+    yield
+    ScenarioBuilder._amortized_payment.cache_clear()
+
+
+def test_amortized_payment_is_cached_per_balance_rate_and_term(empty_payment_cache):
+    monthly_rate = Decimal("15.5") / Decimal(100) / Decimal(12)
+
+    first = ScenarioBuilder._amortized_payment(Decimal("12345.67"), monthly_rate, 36)
+    second = ScenarioBuilder._amortized_payment(Decimal("12345.67"), monthly_rate, 36)
+    ScenarioBuilder._amortized_payment(Decimal("12345.67"), monthly_rate, 24)
+
+    info = ScenarioBuilder._amortized_payment.cache_info()
+    assert first == second
+    assert (info.hits, info.misses) == (1, 2)